@@ -472,6 +472,7 @@ func taskListCmd() *cobra.Command {
 	cmd.Flags().StringVar(&f.Iteration, "iteration", "", "iteration filter")
 	cmd.Flags().StringVar(&f.Parent, "parent", "", "parent task id")
 	cmd.Flags().StringVar(&f.AssigneeID, "assignee-id", "", "assignee filter")
+	cmd.Flags().StringVar(&f.Type, "type", "", "task type filter")
 	return cmd
 }
 
@@ -3,7 +3,8 @@ LangChain + Workline SDK example.
 
 Prereqs:
   - Start Workline API: wl serve --addr 127.0.0.1:8080 --base-path /v0
-  - Install deps: pip install langchain langchain-openai
+  - Install deps: pip install langchain langchain-openai requests httpx
+    (optional: orjson for faster JSON handling)
   - Set OpenAI key: export OPENAI_API_KEY=...
 
 Optional env vars:
@@ -30,38 +31,40 @@ This script:
   8) Logs all agent actions into a Workline "agent log" task.
 """
 
+import asyncio
+import contextvars
+import functools
 import json
 import os
 import re
 import sys
-from datetime import datetime, timezone
+import threading
+import time
+import urllib.parse
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 try:
-    from langchain.agents import create_agent as lc_create_agent
+    import orjson
+except ImportError:  # optional: faster JSON encode/decode
+    orjson = None
 
-    _LC_AGENT_MODE = "graph"
-except ImportError:
-    lc_create_agent = None
-    _LC_AGENT_MODE = "executor"
-
-if _LC_AGENT_MODE == "executor":
-    try:
-        from langchain.agents import AgentExecutor, create_tool_calling_agent
-    except ImportError:
-        from langchain.agents import create_tool_calling_agent
-        from langchain.agents.agent import AgentExecutor
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.tools import tool
-from langchain_openai import ChatOpenAI
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
 
 _ROOT = Path(__file__).resolve().parents[1]
 _SDK_PATH = _ROOT / "sdk" / "python"
 if str(_SDK_PATH) not in sys.path:
     sys.path.insert(0, str(_SDK_PATH))
 
-from workline import APIError, WorklineClient
+from workline import (
+    ATTESTATION_BATCH_MAX,
+    APIError,
+    AsyncWorklineClient,
+    Attestation,
+    WorklineClient,
+    create_session,
+)
 
 BASE_URL = os.getenv("WORKLINE_BASE_URL", "http://127.0.0.1:8080")
 PROJECT_ID = os.getenv("WORKLINE_PROJECT_ID", "example")
@@ -77,28 +80,61 @@ EXECUTOR_ACCESS_TOKEN = os.getenv("WORKLINE_EXECUTOR_ACCESS_TOKEN")
 REVIEWER_ACCESS_TOKEN = os.getenv("WORKLINE_REVIEWER_ACCESS_TOKEN")
 
 
+# All roles talk to the same host; credentials are sent per request, so the
+# role clients share one keep-alive pool.
+_SHARED_SESSION = create_session()
 planner_client = WorklineClient(
     BASE_URL,
     PROJECT_ID,
     api_key=PLANNER_API_KEY or API_KEY,
     access_token=PLANNER_ACCESS_TOKEN or ACCESS_TOKEN,
+    session=_SHARED_SESSION,
 )
 executor_client = WorklineClient(
     BASE_URL,
     PROJECT_ID,
     api_key=EXECUTOR_API_KEY or API_KEY,
     access_token=EXECUTOR_ACCESS_TOKEN or ACCESS_TOKEN,
+    session=_SHARED_SESSION,
 )
 reviewer_client = WorklineClient(
     BASE_URL,
     PROJECT_ID,
     api_key=REVIEWER_API_KEY or API_KEY,
     access_token=REVIEWER_ACCESS_TOKEN or ACCESS_TOKEN,
+    session=_SHARED_SESSION,
 )
 client = planner_client
-CURRENT_WORKSHOP_ID: Optional[str] = None
+# Async planner client for orchestration steps that fan out over many tasks.
+async_client = AsyncWorklineClient(
+    BASE_URL,
+    PROJECT_ID,
+    api_key=PLANNER_API_KEY or API_KEY,
+    access_token=PLANNER_ACCESS_TOKEN or ACCESS_TOKEN,
+)
+# Upper bound on concurrent Workline requests when fanning out.
+WORKLINE_CONCURRENCY = 10
+# Task reads are cached briefly; creates store the returned task and every
+# other write evicts the task it touches.
+_TASK_CACHE_TTL = 30.0
+_TASK_CACHE: Dict[str, Tuple[float, Dict[str, object]]] = {}
+# The server applies each work-outcome write as a read-modify-write of the
+# task's whole work_outcomes map, so concurrent writes to one task could drop
+# updates. Writes to different tasks may overlap; writes to one task queue here.
+_TASK_WRITE_LOCKS: Dict[str, asyncio.Lock] = {}
+# Concurrent coroutines asking for the same task share one in-flight GET.
+_PENDING_TASK_READS: Dict[str, "asyncio.Future[Optional[Dict[str, object]]]"] = {}
+# Workshops run concurrently; a context variable keeps each one's conversation
+# log separate (asyncio tasks and executor threads copy the current context).
+CURRENT_WORKSHOP_ID: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "current_workshop_id", default=None
+)
+# Concurrent workshops share one terminal; only one may prompt at a time.
+_HUMAN_PROMPT_LOCK = threading.Lock()
 
 
+# The mapping only depends on the kind string and returns module-level clients.
+@functools.lru_cache(maxsize=64)
 def _client_for_attestation(kind: str) -> WorklineClient:
     normalized = kind.strip().lower()
     if normalized.startswith("review.") or normalized.startswith("acceptance.") or normalized.startswith("security.") or normalized == "iteration.approved":
@@ -110,10 +146,9 @@ def _client_for_attestation(kind: str) -> WorklineClient:
     return client
 
 
-@tool
-def add_workline_attestation(entity_kind: str, entity_id: str, kind: str) -> Dict[str, str]:
-    """Add an attestation to a Workline entity (task, iteration, etc)."""
-    attestation = _client_for_attestation(kind).add_attestation(entity_kind, entity_id, kind)
+# Agent tools: plain functions, wrapped as LangChain tools by _as_tools when an
+# agent runs. Their docstrings become the tool descriptions.
+def _attestation_summary(attestation: Attestation) -> Dict[str, str]:
     return {
         "id": attestation.id,
         "entity_kind": attestation.entity_kind,
@@ -123,7 +158,29 @@ def add_workline_attestation(entity_kind: str, entity_id: str, kind: str) -> Dic
     }
 
 
-@tool
+def add_workline_attestation(entity_kind: str, entity_id: str, kind: str) -> Dict[str, str]:
+    """Add an attestation to a Workline entity (task, iteration, etc)."""
+    attestation = _client_for_attestation(kind).add_attestation(entity_kind, entity_id, kind)
+    return _attestation_summary(attestation)
+
+
+def add_workline_attestations(entity_kind: str, entity_ids: List[str], kinds: List[str]) -> List[Dict[str, str]]:
+    """Add every attestation kind to every listed entity in as few calls as possible."""
+    # One batch request per attesting role (split at the server's item limit)
+    # instead of one request per attestation.
+    batches: Dict[int, Tuple[WorklineClient, List[Dict[str, str]]]] = {}
+    for kind in kinds:
+        role_client = _client_for_attestation(kind)
+        _, items = batches.setdefault(id(role_client), (role_client, []))
+        items.extend({"entity_kind": entity_kind, "entity_id": entity_id, "kind": kind} for entity_id in entity_ids)
+    results: List[Dict[str, str]] = []
+    for role_client, items in batches.values():
+        for start in range(0, len(items), ATTESTATION_BATCH_MAX):
+            batch = items[start:start + ATTESTATION_BATCH_MAX]
+            results.extend(_attestation_summary(att) for att in role_client.add_attestations(batch))
+    return results
+
+
 def create_workline_task_full(
     title: str,
     task_type: str = "feature",
@@ -146,6 +203,7 @@ def create_workline_task_full(
     if priority is not None:
         body["priority"] = priority
     data = planner_client._request("POST", planner_client._project_path("tasks"), body)
+    _invalidate_task(data["id"])
     return {
         "id": data["id"],
         "title": data["title"],
@@ -157,7 +215,6 @@ def create_workline_task_full(
     }
 
 
-@tool
 def create_workline_iteration(iteration_id: str, goal: str) -> Dict[str, str]:
     """Create a Workline iteration."""
     body = {"id": iteration_id, "goal": goal}
@@ -165,7 +222,6 @@ def create_workline_iteration(iteration_id: str, goal: str) -> Dict[str, str]:
     return {"id": data["id"], "goal": data["goal"], "status": data["status"]}
 
 
-@tool
 def set_workline_iteration_status(iteration_id: str, status: str, force: bool = False) -> Dict[str, str]:
     """Update Workline iteration status (pending -> running -> delivered -> validated)."""
     body = {"status": status}
@@ -176,26 +232,26 @@ def set_workline_iteration_status(iteration_id: str, status: str, force: bool =
     return {"id": data["id"], "status": data["status"]}
 
 
-@tool
 def latest_workline_events(limit: int = 5) -> List[Dict[str, str]]:
     """Fetch the latest Workline events for audit/debugging."""
-    events = planner_client.events(limit)
+    # Only a few fields are read, so skip building Event objects.
+    events = planner_client.events_raw(limit)
     return [
         {
-            "id": str(event.id),
-            "type": event.type,
-            "entity_kind": event.entity_kind,
-            "entity_id": event.entity_id,
-            "actor_id": event.actor_id,
+            "id": str(event["id"]),
+            "type": event["type"],
+            "entity_kind": event.get("entity_kind"),
+            "entity_id": event.get("entity_id"),
+            "actor_id": event.get("actor_id"),
         }
         for event in events
     ]
 
 
-@tool
 def list_workline_iterations(limit: int = 50) -> List[Dict[str, str]]:
     """List recent iterations."""
-    data = planner_client._request("GET", planner_client._project_path(f"iterations?limit={limit}"))
+    query = urllib.parse.urlencode({"limit": limit})
+    data = planner_client._request("GET", planner_client._project_path(f"iterations?{query}"))
     items = data.get("items", data)
     return [
         {"id": item["id"], "goal": item["goal"], "status": item["status"]}
@@ -203,16 +259,15 @@ def list_workline_iterations(limit: int = 50) -> List[Dict[str, str]]:
     ]
 
 
-@tool
 def list_workline_tasks(iteration_id: Optional[str] = None, status: Optional[str] = None, limit: int = 50) -> List[Dict[str, str]]:
     """List tasks, optionally filtered by iteration or status."""
-    params = []
+    params: Dict[str, object] = {}
     if iteration_id:
-        params.append(f"iteration_id={iteration_id}")
+        params["iteration_id"] = iteration_id
     if status:
-        params.append(f"status={status}")
-    params.append(f"limit={limit}")
-    query = "&".join(params)
+        params["status"] = status
+    params["limit"] = limit
+    query = urllib.parse.urlencode(params)
     data = planner_client._request("GET", planner_client._project_path(f"tasks?{query}"))
     items = data.get("items", data)
     return [
@@ -227,21 +282,92 @@ def list_workline_tasks(iteration_id: Optional[str] = None, status: Optional[str
     ]
 
 
-@tool
 def update_workline_task_priority(task_id: str, priority: int) -> Dict[str, object]:
     """Set priority for a Workline task."""
     body = {"priority": priority}
     data = planner_client._request("PATCH", planner_client._project_path(f"tasks/{task_id}"), body)
+    _invalidate_task(task_id)
     return {"id": data["id"], "priority": data.get("priority"), "status": data.get("status")}
 
 
+def _cached_task(task_id: str) -> Optional[Dict[str, object]]:
+    entry = _TASK_CACHE.get(task_id)
+    if entry is None:
+        return None
+    stored_at, task = entry
+    if time.monotonic() - stored_at > _TASK_CACHE_TTL:
+        _TASK_CACHE.pop(task_id, None)
+        return None
+    return task
+
+
+def _cache_task(task_id: str, task: Optional[Dict[str, object]]) -> Optional[Dict[str, object]]:
+    if task is not None:
+        _TASK_CACHE[task_id] = (time.monotonic(), task)
+    return task
+
+
+def _invalidate_task(task_id: str) -> None:
+    _TASK_CACHE.pop(task_id, None)
+
+
 def _get_task(task_id: str) -> Optional[Dict[str, object]]:
+    task = _cached_task(task_id)
+    if task is not None:
+        return task
+    try:
+        task = client._request("GET", client._project_path(f"tasks/{task_id}"))
+    except APIError as err:
+        if err.status_code == 404:
+            return None
+        raise
+    return _cache_task(task_id, task)
+
+
+async def _aget_task(task_id: str) -> Optional[Dict[str, object]]:
+    task = _cached_task(task_id)
+    if task is not None:
+        return task
+    pending = _PENDING_TASK_READS.get(task_id)
+    if pending is None:
+        pending = asyncio.ensure_future(_afetch_task(task_id))
+        _PENDING_TASK_READS[task_id] = pending
+
+        def _forget(done: "asyncio.Future[Optional[Dict[str, object]]]") -> None:
+            if _PENDING_TASK_READS.get(task_id) is done:
+                del _PENDING_TASK_READS[task_id]
+
+        pending.add_done_callback(_forget)
+    # Shield so one cancelled caller does not cancel the read for the others.
+    return await asyncio.shield(pending)
+
+
+async def _afetch_task(task_id: str) -> Optional[Dict[str, object]]:
     try:
-        return client._request("GET", client._project_path(f"tasks/{task_id}"))
+        task = await async_client._request("GET", async_client._project_path(f"tasks/{task_id}"))
     except APIError as err:
         if err.status_code == 404:
             return None
         raise
+    return _cache_task(task_id, task)
+
+
+def put_task_outcome(task_id: str, path: str, value: object) -> None:
+    client.put_work_outcomes(task_id, path, value)
+    _invalidate_task(task_id)
+
+
+def _task_write_lock(task_id: str) -> asyncio.Lock:
+    lock = _TASK_WRITE_LOCKS.get(task_id)
+    if lock is None:
+        lock = _TASK_WRITE_LOCKS[task_id] = asyncio.Lock()
+    return lock
+
+
+async def aput_task_outcome(task_id: str, path: str, value: object) -> None:
+    async with _task_write_lock(task_id):
+        await async_client.put_work_outcomes(task_id, path, value)
+    _invalidate_task(task_id)
 
 
 def _create_problem_refinement_task(task_id: str) -> Dict[str, object]:
@@ -252,7 +378,7 @@ def _create_problem_refinement_task(task_id: str) -> Dict[str, object]:
         "description": "Capture the refined problem statement and assumptions.",
         "policy": {"preset": "workshop.problem_refinement"},
     }
-    return client._request("POST", client._project_path("tasks"), body)
+    return _cache_task(task_id, client._request("POST", client._project_path("tasks"), body))
 
 
 def ensure_problem_refinement_task() -> str:
@@ -268,120 +394,210 @@ def _ensure_problem_refinement_task_exists() -> Dict[str, object]:
     return task
 
 
+def _workshop_task_body(task_id: str, title: str, preset: str, description: str) -> Dict[str, object]:
+    return {
+        "id": task_id,
+        "title": title,
+        "type": "workshop",
+        "description": description,
+        "policy": {"preset": preset},
+    }
+
+
 def ensure_workshop_task(task_id: str, title: str, preset: str, description: str) -> Dict[str, object]:
     task = _get_task(task_id)
     if task is None:
-        body = {
-            "id": task_id,
-            "title": title,
-            "type": "workshop",
-            "description": description,
-            "policy": {"preset": preset},
-        }
-        task = client._request("POST", client._project_path("tasks"), body)
+        body = _workshop_task_body(task_id, title, preset, description)
+        task = _cache_task(task_id, client._request("POST", client._project_path("tasks"), body))
+    return task
+
+
+async def aensure_workshop_task(task_id: str, title: str, preset: str, description: str) -> Dict[str, object]:
+    task = await _aget_task(task_id)
+    if task is None:
+        body = _workshop_task_body(task_id, title, preset, description)
+        task = _cache_task(task_id, await async_client._request("POST", async_client._project_path("tasks"), body))
     return task
 
 
 def set_current_workshop(task_id: Optional[str]) -> None:
-    global CURRENT_WORKSHOP_ID
-    CURRENT_WORKSHOP_ID = task_id
+    CURRENT_WORKSHOP_ID.set(task_id)
 
 
-def append_workshop_conversation(task_id: str, question: str, answer: str) -> None:
-    entry = {
-        "ts": datetime.now(timezone.utc).isoformat(),
+_TS_SECOND_CACHE: Tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """UTC ISO-8601 timestamp shaped like datetime.now(timezone.utc).isoformat()."""
+    global _TS_SECOND_CACHE
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _TS_SECOND_CACHE
+    if cached_second != second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _TS_SECOND_CACHE = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1_000_000):06d}+00:00"
+
+
+def _conversation_entry(question: str, answer: str) -> Dict[str, str]:
+    return {
+        "ts": _utc_timestamp(),
         "question": question,
         "answer": answer,
     }
-    client.append_work_outcomes(task_id, "conversation", entry)
+
+
+def append_workshop_conversation(task_id: str, question: str, answer: str) -> None:
+    client.append_work_outcomes(task_id, "conversation", _conversation_entry(question, answer))
+    _invalidate_task(task_id)
+
+
+async def aappend_workshop_conversation(task_id: str, question: str, answer: str) -> None:
+    entry = _conversation_entry(question, answer)
+    async with _task_write_lock(task_id):
+        await async_client.append_work_outcomes(task_id, "conversation", entry)
+    _invalidate_task(task_id)
+
+
+def _text_outcomes(task: Optional[Dict[str, object]], keys: Sequence[str]) -> Dict[str, Optional[str]]:
+    outcomes = (task or {}).get("work_outcomes") or {}
+    values: Dict[str, Optional[str]] = {}
+    for key in keys:
+        value = outcomes.get(key)
+        values[key] = value if isinstance(value, str) and value.strip() else None
+    return values
+
+
+def _get_task_outcomes(task_id: str, keys: Sequence[str]) -> Dict[str, Optional[str]]:
+    """Read several non-empty text work outcomes of a task with one GET."""
+    return _text_outcomes(_get_task(task_id), keys)
+
+
+async def _aget_task_outcomes(task_id: str, keys: Sequence[str]) -> Dict[str, Optional[str]]:
+    return _text_outcomes(await _aget_task(task_id), keys)
 
 
 def get_workshop_output(task_id: str) -> Optional[str]:
-    task = _get_task(task_id)
-    if not task:
-        return None
-    outcomes = task.get("work_outcomes") or {}
-    output = outcomes.get("output")
-    if isinstance(output, str) and output.strip():
-        return output
-    return None
+    return _get_task_outcomes(task_id, ("output",))["output"]
+
+
+async def aget_workshop_output(task_id: str) -> Optional[str]:
+    return (await _aget_task_outcomes(task_id, ("output",)))["output"]
 
 
 def set_workshop_output(task_id: str, output: str) -> None:
-    client.put_work_outcomes(task_id, "output", output)
-    client.put_work_outcomes(task_id, "summary", output)
+    put_task_outcome(task_id, "output", output)
+    put_task_outcome(task_id, "summary", output)
     append_workshop_conversation(task_id, "Workshop summary", output)
 
 
+async def aset_workshop_output(task_id: str, output: str) -> None:
+    await aput_task_outcome(task_id, "output", output)
+    await aput_task_outcome(task_id, "summary", output)
+    await aappend_workshop_conversation(task_id, "Workshop summary", output)
+
+
 def get_problem_statement_from_workline() -> Optional[str]:
-    task = _get_task("problem-refinement")
-    if not task:
-        return None
-    work_outcomes = task.get("work_outcomes") or {}
-    statement = work_outcomes.get("problem_statement")
-    if isinstance(statement, str) and statement.strip():
-        return statement
-    return None
+    return _get_task_outcomes("problem-refinement", ("problem_statement",))["problem_statement"]
 
 
 def set_problem_statement_in_workline(problem_statement: str) -> None:
     task = _ensure_problem_refinement_task_exists()
-    client.put_work_outcomes(task["id"], "problem_statement", problem_statement)
+    put_task_outcome(task["id"], "problem_statement", problem_statement)
 
 
 def log_conversation(question: str, answer: str) -> None:
-    if CURRENT_WORKSHOP_ID is None:
+    current = CURRENT_WORKSHOP_ID.get()
+    if current is None:
         ensure_problem_refinement_task()
-    task_id = CURRENT_WORKSHOP_ID or "problem-refinement"
+    task_id = current or "problem-refinement"
     append_workshop_conversation(task_id, question, answer)
 
 
+# Discovery key -> workshop task holding that phase's output.
+DISCOVERY_WORKSHOP_TASKS = {
+    "initial": "problem-refinement",
+    "event_storming": "workshop-eventstorming",
+    "decision_workshop": "workshop-decision",
+    "clarify": "workshop-clarify",
+}
+
+
+def _list_tasks_by_type(task_type: str) -> Tuple[Dict[str, Dict[str, object]], bool]:
+    """Return the first page of tasks of a type keyed by id, and whether more pages exist."""
+    query = urllib.parse.urlencode({"type": task_type, "limit": 200})
+    data = client._request("GET", client._project_path(f"tasks?{query}"))
+    tasks: Dict[str, Dict[str, object]] = {}
+    for item in data.get("items", []):
+        tasks[item["id"]] = _cache_task(item["id"], item)
+    return tasks, bool(data.get("next_cursor"))
+
+
 def get_problem_refinement_discovery() -> Optional[Dict[str, object]]:
-    outputs = {
-        "initial": get_workshop_output("problem-refinement"),
-        "event_storming": get_workshop_output("workshop-eventstorming"),
-        "decision_workshop": get_workshop_output("workshop-decision"),
-        "clarify": get_workshop_output("workshop-clarify"),
-    }
+    # One list call tells us which workshops exist and carries their outcomes.
+    workshops, truncated = _list_tasks_by_type("workshop")
+    outputs: Dict[str, Optional[str]] = {}
+    for key, task_id in DISCOVERY_WORKSHOP_TASKS.items():
+        task = workshops.get(task_id)
+        if task is None and truncated:
+            task = _get_task(task_id)
+        outputs[key] = _text_outcomes(task, ("output",))["output"]
     if not any(outputs.values()):
         return None
     return {k: v for k, v in outputs.items() if v}
 
 
+def _write_prompt(text: str) -> None:
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def _readline_stripped() -> str:
+    line = sys.stdin.readline()
+    if line == "":
+        raise RuntimeError("stdin closed while waiting for input")
+    return line.strip()
+
+
 def ask_human_question_local(question: str, options: Optional[List[str]] = None) -> str:
     if HUMAN_REVIEW_MODE == "interactive":
         if not sys.stdin.isatty():
             raise RuntimeError("stdin is not interactive; run without make or attach a TTY.")
-        print("\n=== Question ===\n", flush=True)
-        print(question, flush=True)
-        if options:
-            for idx, opt in enumerate(options, start=1):
-                print(f"{idx}. {opt}", flush=True)
-        while True:
-            print("Your answer: ", end="", flush=True)
-            answer = sys.stdin.readline()
-            if answer == "":
-                raise RuntimeError("stdin closed while waiting for input")
-            answer = answer.strip()
-            if answer:
-                if options and answer.isdigit():
-                    choice = int(answer)
-                    if 1 <= choice <= len(options):
-                        selected = options[choice - 1]
-                        if selected.lower().startswith("other"):
-                            detail = input("Please specify: ").strip()
-                            if detail:
-                                log_conversation(question, detail)
-                                return detail
-                        log_conversation(question, selected)
-                        return selected
-                log_conversation(question, answer)
-                return answer
-            print("Please enter a non-empty answer.", flush=True)
+        with _HUMAN_PROMPT_LOCK:
+            return _prompt_human_question(question, options)
     raise RuntimeError("HUMAN_REVIEW_MODE must be interactive; simulation is disabled.")
 
 
-@tool
+def _prompt_human_question(question: str, options: Optional[List[str]]) -> str:
+    # Name the asking workshop: concurrent workshops queue their questions here.
+    workshop = CURRENT_WORKSHOP_ID.get() or "problem-refinement"
+    _write_prompt(
+        f"\n=== Question ({workshop}) ===\n\n"
+        + question
+        + "\n"
+        + "".join(f"{idx}. {opt}\n" for idx, opt in enumerate(options or [], start=1))
+    )
+    while True:
+        _write_prompt("Your answer: ")
+        answer = _readline_stripped()
+        if answer:
+            if options and answer.isdigit():
+                choice = int(answer)
+                if 1 <= choice <= len(options):
+                    selected = options[choice - 1]
+                    if selected.lower().startswith("other"):
+                        _write_prompt("Please specify: ")
+                        detail = _readline_stripped()
+                        if detail:
+                            log_conversation(question, detail)
+                            return detail
+                    log_conversation(question, selected)
+                    return selected
+            log_conversation(question, answer)
+            return answer
+        print("Please enter a non-empty answer.", flush=True)
+
+
 def ask_human_question(question: str, options: Optional[List[str]] = None) -> str:
     """Ask a human for a decision or clarification."""
     return ask_human_question_local(question, options)
@@ -391,17 +607,16 @@ def ask_human_for_review(draft: str) -> str:
     if HUMAN_REVIEW_MODE == "interactive":
         if not sys.stdin.isatty():
             raise RuntimeError("stdin is not interactive; run without make or attach a TTY.")
-        print("\n=== Draft Plan (for review) ===\n", flush=True)
-        print(draft, flush=True)
-        print("\n=== Provide edits or approvals ===\n", flush=True)
-        print("1. approve", flush=True)
-        print("2. request changes", flush=True)
+        _write_prompt(
+            "\n=== Draft Plan (for review) ===\n\n"
+            + draft
+            + "\n\n=== Provide edits or approvals ===\n\n"
+            + "1. approve\n"
+            + "2. request changes\n"
+        )
         while True:
-            print("Enter review feedback (or 'approve'): ", end="", flush=True)
-            feedback = sys.stdin.readline()
-            if feedback == "":
-                raise RuntimeError("stdin closed while waiting for input")
-            feedback = feedback.strip()
+            _write_prompt("Enter review feedback (or 'approve'): ")
+            feedback = _readline_stripped()
             if feedback:
                 if feedback.isdigit():
                     if feedback == "1":
@@ -415,44 +630,74 @@ def ask_human_for_review(draft: str) -> str:
 
 
 
-def _run_agent(model: ChatOpenAI, system_prompt: str, user_input: str, tools: List) -> str:
-    if not tools:
-        response = model.invoke(
-            [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_input},
-            ]
-        )
-        if hasattr(response, "content"):
-            return response.content
-        return str(response)
-    if _LC_AGENT_MODE == "graph" and lc_create_agent is not None and tools:
-        try:
-            agent = lc_create_agent(
-                model,
-                tools=tools,
-                system_prompt=system_prompt,
-                debug=True,
-                interrupt_after=["tools"],
-            )
-            result = agent.invoke({"messages": [{"role": "user", "content": user_input}]})
-            messages = result.get("messages", [])
-            for msg in reversed(messages):
-                if hasattr(msg, "content"):
-                    return msg.content
-                if isinstance(msg, dict) and msg.get("content"):
-                    return msg["content"]
-            return ""
-        except ValueError:
-            pass
+def _chat_messages(system_prompt: str, user_input: str) -> List[Dict[str, str]]:
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_input},
+    ]
+
+
+def _response_text(response: object) -> str:
+    if hasattr(response, "content"):
+        return response.content
+    return str(response)
 
+
+def _graph_agent_output(result: Dict[str, object]) -> str:
+    messages = result.get("messages", [])
+    for msg in reversed(messages):
+        if hasattr(msg, "content"):
+            return msg.content
+        if isinstance(msg, dict) and msg.get("content"):
+            return msg["content"]
+    return ""
+
+
+# LangChain is imported on first use so the example starts without loading it.
+@functools.lru_cache(maxsize=None)
+def _as_tool(fn: Callable) -> Any:
+    from langchain_core.tools import tool
+
+    return tool(fn)
+
+
+def _as_tools(fns: Sequence[Callable]) -> List[Any]:
+    return [_as_tool(fn) for fn in fns]
+
+
+@functools.lru_cache(maxsize=None)
+def _graph_agent_factory() -> Optional[Callable]:
     try:
-        create_agent_fn = create_tool_calling_agent
-    except NameError:
-        from langchain.agents import create_tool_calling_agent as create_agent_fn
-        from langchain.agents.agent import AgentExecutor as Executor
-    else:
-        Executor = AgentExecutor
+        from langchain.agents import create_agent
+    except ImportError:
+        return None
+    return create_agent
+
+
+@functools.lru_cache(maxsize=None)
+def _agent_executor_factories() -> Tuple[Callable, Callable]:
+    try:
+        from langchain.agents import AgentExecutor, create_tool_calling_agent
+    except ImportError:
+        from langchain.agents import create_tool_calling_agent
+        from langchain.agents.agent import AgentExecutor
+    return create_tool_calling_agent, AgentExecutor
+
+
+def _create_graph_agent(create_agent: Callable, model: "ChatOpenAI", system_prompt: str, tools: List):
+    return create_agent(
+        model,
+        tools=tools,
+        system_prompt=system_prompt,
+        debug=True,
+        interrupt_after=["tools"],
+    )
+
+
+def _create_agent_executor(model: "ChatOpenAI", system_prompt: str, user_input: str, tools: List):
+    from langchain_core.prompts import ChatPromptTemplate
+
+    create_tool_calling_agent, AgentExecutor = _agent_executor_factories()
     prompt = ChatPromptTemplate.from_messages(
         [
             ("system", system_prompt),
@@ -460,26 +705,208 @@ def _run_agent(model: ChatOpenAI, system_prompt: str, user_input: str, tools: Li
             ("placeholder", "{agent_scratchpad}"),
         ]
     )
-    agent = create_agent_fn(model, tools, prompt)
-    executor = Executor(agent=agent, tools=tools, verbose=True, max_iterations=6)
+    agent = create_tool_calling_agent(model, tools, prompt)
+    return AgentExecutor(agent=agent, tools=tools, verbose=True, max_iterations=6)
+
+
+class _StreamCollector:
+    """Accumulates streamed model output; optionally reports when the expected JSON payload is complete."""
+
+    def __init__(self, json_shape: Optional[Callable[[object], bool]]) -> None:
+        self._parts: List[str] = []
+        self._scanner = _JsonSpanScanner() if json_shape is not None else None
+        self._shape = json_shape
+        self._text = ""
+
+    def add(self, chunk: object) -> bool:
+        """Append a chunk; return True once a JSON value matching the shape has been seen."""
+        piece = _response_text(chunk)
+        self._parts.append(piece)
+        if self._scanner is None:
+            return False
+        spans = self._scanner.feed(piece)
+        if not spans:
+            return False
+        text = self.text()
+        for start, end in spans:
+            try:
+                value = _json_loads(text[start:end])
+            except json.JSONDecodeError:
+                continue
+            if self._shape(value):
+                return True
+        return False
+
+    def text(self) -> str:
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+
+def _run_agent(model: "ChatOpenAI", system_prompt: str, user_input: str, tools: List) -> str:
+    if not tools:
+        return _response_text(model.invoke(_chat_messages(system_prompt, user_input)))
+    tools = _as_tools(tools)
+    create_agent = _graph_agent_factory()
+    if create_agent is not None:
+        try:
+            agent = _create_graph_agent(create_agent, model, system_prompt, tools)
+            result = agent.invoke({"messages": [{"role": "user", "content": user_input}]})
+            return _graph_agent_output(result)
+        except ValueError:
+            pass
+    executor = _create_agent_executor(model, system_prompt, user_input, tools)
     return executor.invoke({"input": ""})["output"]
 
 
-def _extract_json_payload(text: str) -> Optional[object]:
+async def _run_agent_async(
+    model: "ChatOpenAI",
+    system_prompt: str,
+    user_input: str,
+    tools: List,
+    json_shape: Optional[Callable[[object], bool]] = None,
+) -> str:
+    if not tools:
+        # Stream so a JSON answer can be returned without waiting for trailing prose.
+        collector = _StreamCollector(json_shape)
+        stream = model.astream(_chat_messages(system_prompt, user_input))
+        try:
+            async for chunk in stream:
+                if collector.add(chunk):
+                    break
+        finally:
+            await stream.aclose()
+        return collector.text()
+    tools = _as_tools(tools)
+    create_agent = _graph_agent_factory()
+    if create_agent is not None:
+        try:
+            agent = _create_graph_agent(create_agent, model, system_prompt, tools)
+            result = await agent.ainvoke({"messages": [{"role": "user", "content": user_input}]})
+            return _graph_agent_output(result)
+        except ValueError:
+            pass
+    executor = _create_agent_executor(model, system_prompt, user_input, tools)
+    return (await executor.ainvoke({"input": ""}))["output"]
+
+
+# Prompt payloads are serialized compactly: indentation only costs tokens.
+# OPT_NON_STR_KEYS accepts the same dict keys as stdlib json.
+if orjson is not None:
+
+    def _json_loads(text: str) -> object:
+        return orjson.loads(text)
+
+    def _json_dumps_compact(value: object) -> str:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def _print_json(value: object) -> None:
+        # Write orjson's UTF-8 bytes straight to stdout, skipping a str round trip.
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS) + b"\n")
+        sys.stdout.buffer.flush()
+
+else:
+    _json_loads = json.loads
+
+    def _json_dumps_compact(value: object) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+    def _print_json(value: object) -> None:
+        print(json.dumps(value, indent=2))
+
+
+_JSON_CLOSERS = {"{": "}", "[": "]"}
+
+
+class _JsonSpanScanner:
+    """Find bracket-balanced spans in text fed incrementally, in one linear pass.
+
+    Outermost spans are returned by feed() as soon as they close. Brackets
+    inside string literals are ignored. When an opener is never closed (or is
+    closed by the wrong bracket) the balanced spans found inside it are
+    returned instead, by feed() on the mismatch or by finish().
+    """
+
+    def __init__(self) -> None:
+        # Each open level: (expected closer, start offset, balanced child spans).
+        self._stack: List[Tuple[str, int, List[Tuple[int, int]]]] = []
+        self._in_string = False
+        self._escaped = False
+        self._offset = 0
+
+    def feed(self, chunk: str) -> List[Tuple[int, int]]:
+        spans: List[Tuple[int, int]] = []
+        stack = self._stack
+        in_string = self._in_string
+        escaped = self._escaped
+        for i, ch in enumerate(chunk, self._offset):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch in _JSON_CLOSERS:
+                stack.append((_JSON_CLOSERS[ch], i, []))
+            elif stack and (ch == "}" or ch == "]"):
+                if ch == stack[-1][0]:
+                    _, start, _ = stack.pop()
+                    if stack:
+                        stack[-1][2].append((start, i + 1))
+                    else:
+                        spans.append((start, i + 1))
+                else:
+                    spans.extend(self.finish())
+            elif stack and ch == '"':
+                in_string = True
+        self._in_string = in_string
+        self._escaped = escaped
+        self._offset += len(chunk)
+        return spans
+
+    def finish(self) -> List[Tuple[int, int]]:
+        spans = [span for _, _, children in self._stack for span in children]
+        self._stack.clear()
+        return spans
+
+
+def _json_spans(text: str) -> Iterator[Tuple[int, int]]:
+    scanner = _JsonSpanScanner()
+    yield from scanner.feed(text)
+    yield from scanner.finish()
+
+
+def _extract_json_payload(text: str, shape: Callable[[object], bool]) -> Optional[object]:
+    # Only values accepted by shape count, so bracketed asides in a preamble
+    # ("see [1]") are skipped. orjson.JSONDecodeError subclasses json.JSONDecodeError.
     try:
-        return json.loads(text)
+        value = _json_loads(text)
     except json.JSONDecodeError:
         pass
-    match = re.search(r"(\{.*\}|\[.*\])", text, re.DOTALL)
-    if not match:
-        return None
-    try:
-        return json.loads(match.group(1))
-    except json.JSONDecodeError:
-        return None
+    else:
+        if shape(value):
+            return value
+    for start, end in _json_spans(text):
+        try:
+            value = _json_loads(text[start:end])
+        except json.JSONDecodeError:
+            continue
+        if shape(value):
+            return value
+    return None
+
+
+def _is_spec_payload(value: object) -> bool:
+    return isinstance(value, dict) and ("prd" in value or "gherkin" in value)
 
 
-def run_discovery(model: ChatOpenAI, problem_statement: str) -> str:
+def _is_feature_list(value: object) -> bool:
+    return isinstance(value, list) and bool(value) and all(isinstance(entry, dict) for entry in value)
+
+
+def run_discovery(model: "ChatOpenAI", problem_statement: str) -> str:
     system_prompt = (
         "You are a product planner starting a discovery phase. First, refine "
         "the provided problem statement into clear goals and scope. Only ask "
@@ -493,7 +920,7 @@ def run_discovery(model: ChatOpenAI, problem_statement: str) -> str:
     return _run_agent(model, system_prompt, problem_statement, tools)
 
 
-def run_discovery_phase(model: ChatOpenAI, phase_name: str, context: str) -> str:
+async def run_discovery_phase(model: "ChatOpenAI", phase_name: str, context: str) -> str:
     system_prompt = (
         f"You are facilitating a discovery workshop phase: {phase_name}. "
         "Ask clarifying questions when needed using ask_human_question, and "
@@ -502,47 +929,63 @@ def run_discovery_phase(model: ChatOpenAI, phase_name: str, context: str) -> str
         "Return a concise summary with decisions, risks, and open questions."
     )
     tools = [ask_human_question]
-    return _run_agent(model, system_prompt, context, tools)
+    return await _run_agent_async(model, system_prompt, context, tools)
 
 
-def run_workshop_next_steps(model: ChatOpenAI, phase_name: str, context: str) -> str:
+async def run_workshop_next_steps(model: "ChatOpenAI", phase_name: str, context: str) -> str:
     system_prompt = (
         f"You just completed the {phase_name} workshop. "
         "Plan the next steps needed to reach the iteration goal. "
         "Return a concise, ordered list with owners if possible."
     )
-    return _run_agent(model, system_prompt, context, tools=[])
+    return await _run_agent_async(model, system_prompt, context, tools=[])
+
+
+async def run_workshop(model: "ChatOpenAI", task_id: str, phase_name: str, context: str) -> str:
+    output = await aget_workshop_output(task_id)
+    if output:
+        return output
+    set_current_workshop(task_id)
+    output = await run_discovery_phase(model, phase_name, context)
+    set_current_workshop(None)
+    await aset_workshop_output(task_id, output)
+    next_steps = await run_workshop_next_steps(model, phase_name, context)
+    await aput_task_outcome(task_id, "next_steps", next_steps)
+    return output
 
 
-def continue_discovery(
-    model: ChatOpenAI,
+async def continue_discovery(
+    model: "ChatOpenAI",
     problem_statement: str,
     existing: Optional[Dict[str, object]],
 ) -> Dict[str, object]:
     discovery: Dict[str, object] = existing or {}
-    ensure_workshop_task(
-        "problem-refinement",
-        "Problem refinement",
-        "workshop.problem_refinement",
-        "Refine the problem statement and clarify scope.",
-    )
-    ensure_workshop_task(
-        "workshop-eventstorming",
-        "Event storming",
-        "workshop.eventstorming",
-        "Map domain events and flows.",
-    )
-    ensure_workshop_task(
-        "workshop-decision",
-        "Decision workshop",
-        "workshop.decision",
-        "Capture key trade-offs and decisions.",
-    )
-    ensure_workshop_task(
-        "workshop-clarify",
-        "Clarification workshop",
-        "workshop.clarify",
-        "Resolve open questions and assumptions.",
+    # Independent tasks: look up (and create when missing) all of them at once.
+    await asyncio.gather(
+        aensure_workshop_task(
+            "problem-refinement",
+            "Problem refinement",
+            "workshop.problem_refinement",
+            "Refine the problem statement and clarify scope.",
+        ),
+        aensure_workshop_task(
+            "workshop-eventstorming",
+            "Event storming",
+            "workshop.eventstorming",
+            "Map domain events and flows.",
+        ),
+        aensure_workshop_task(
+            "workshop-decision",
+            "Decision workshop",
+            "workshop.decision",
+            "Capture key trade-offs and decisions.",
+        ),
+        aensure_workshop_task(
+            "workshop-clarify",
+            "Clarification workshop",
+            "workshop.clarify",
+            "Resolve open questions and assumptions.",
+        ),
     )
     if "initial" not in discovery or not str(discovery.get("initial", "")).strip():
         initial_output = get_workshop_output("problem-refinement")
@@ -558,40 +1001,23 @@ def continue_discovery(
             f"Initial Refinement:\n{discovery.get('initial','')}",
         ]
     )
-    if "event_storming" not in discovery:
-        event_out = get_workshop_output("workshop-eventstorming")
-        if not event_out:
-            set_current_workshop("workshop-eventstorming")
-            event_out = run_discovery_phase(model, "Event Storming", context)
-            set_current_workshop(None)
-            set_workshop_output("workshop-eventstorming", event_out)
-            next_steps = run_workshop_next_steps(model, "Event Storming", context)
-            client.put_work_outcomes("workshop-eventstorming", "next_steps", next_steps)
-        discovery["event_storming"] = event_out
-    if "decision_workshop" not in discovery:
-        decision_out = get_workshop_output("workshop-decision")
-        if not decision_out:
-            set_current_workshop("workshop-decision")
-            decision_out = run_discovery_phase(model, "Decision Workshop", context)
-            set_current_workshop(None)
-            set_workshop_output("workshop-decision", decision_out)
-            next_steps = run_workshop_next_steps(model, "Decision Workshop", context)
-            client.put_work_outcomes("workshop-decision", "next_steps", next_steps)
-        discovery["decision_workshop"] = decision_out
-    if "clarify" not in discovery:
-        clarify_out = get_workshop_output("workshop-clarify")
-        if not clarify_out:
-            set_current_workshop("workshop-clarify")
-            clarify_out = run_discovery_phase(model, "Clarification", context)
-            set_current_workshop(None)
-            set_workshop_output("workshop-clarify", clarify_out)
-            next_steps = run_workshop_next_steps(model, "Clarification", context)
-            client.put_work_outcomes("workshop-clarify", "next_steps", next_steps)
-        discovery["clarify"] = clarify_out
+    # The remaining workshops only depend on the initial refinement, so they
+    # run concurrently.
+    workshops = [
+        ("event_storming", "workshop-eventstorming", "Event Storming"),
+        ("decision_workshop", "workshop-decision", "Decision Workshop"),
+        ("clarify", "workshop-clarify", "Clarification"),
+    ]
+    pending = [(key, task_id, phase) for key, task_id, phase in workshops if key not in discovery]
+    outputs = await asyncio.gather(
+        *(run_workshop(model, task_id, phase, context) for _, task_id, phase in pending)
+    )
+    for (key, _, _), output in zip(pending, outputs):
+        discovery[key] = output
     return discovery
 
 
-def run_planner(model: ChatOpenAI, discovery_output: str) -> str:
+def run_planner(model: "ChatOpenAI", discovery_output: str) -> str:
     system_prompt = (
         "You are a product owner running agile planning. Based on discovery, "
         "create a one-iteration plan with dependencies and owners. Workline "
@@ -609,7 +1035,7 @@ def run_planner(model: ChatOpenAI, discovery_output: str) -> str:
     return _run_agent(model, system_prompt, discovery_output, tools)
 
 
-def run_workline(model: ChatOpenAI, final_plan: str) -> str:
+def run_workline(model: "ChatOpenAI", final_plan: str) -> str:
     system_prompt = (
         "You are a delivery lead. You will receive a finalized agile plan that "
         "includes an Iteration ID and Sprint Backlog. Do the following:\n"
@@ -626,7 +1052,8 @@ def run_workline(model: ChatOpenAI, final_plan: str) -> str:
         "7) Ask the human if demo/review is approved. If approved, add an "
         "iteration.approved attestation on the iteration.\n"
         "8) Move iteration to delivered, then validated.\n"
-        "9) Add ci.passed and review.approved attestations for each task.\n"
+        "9) Add ci.passed and review.approved attestations for all tasks with "
+        "a single add_workline_attestations call.\n"
         "10) Call latest_workline_events.\n"
         "Use ask_human_question for any decision points and provide options. "
         "Ask at most one question at a time. Output a short "
@@ -638,6 +1065,7 @@ def run_workline(model: ChatOpenAI, final_plan: str) -> str:
         create_workline_task_full,
         update_workline_task_priority,
         add_workline_attestation,
+        add_workline_attestations,
         latest_workline_events,
         list_workline_iterations,
         list_workline_tasks,
@@ -646,8 +1074,12 @@ def run_workline(model: ChatOpenAI, final_plan: str) -> str:
     return _run_agent(model, system_prompt, final_plan, tools)
 
 
+# Matches "Iteration ID: iter-1", tolerating markdown emphasis around the label.
+_ITERATION_ID_RE = re.compile(r"iteration id[*_\s]*[:\-][*_\s]*([\w-]+)", re.IGNORECASE)
+
+
 def _extract_iteration_id(plan: str) -> Optional[str]:
-    match = re.search(r"iteration id\\s*[:\\-]\\s*([\\w-]+)", plan, re.IGNORECASE)
+    match = _ITERATION_ID_RE.search(plan)
     if not match:
         return None
     return match.group(1).strip()
@@ -660,7 +1092,7 @@ def _list_iteration_tasks_for_context(iteration_id: str) -> List[Dict[str, str]]
         return []
 
 
-def run_specifications(model: ChatOpenAI, discovery: Dict[str, object], plan: str) -> Dict[str, str]:
+async def run_specifications(model: "ChatOpenAI", discovery: Dict[str, object], plan: str) -> Dict[str, str]:
     system_prompt = (
         "You are a product analyst. Produce a PRD and functional specifications "
         "for ALL features in the plan. Use the discovery context. "
@@ -672,12 +1104,12 @@ def run_specifications(model: ChatOpenAI, discovery: Dict[str, object], plan: st
     )
     user_input = (
         "Discovery:\n"
-        + json.dumps(discovery, indent=2)
+        + _json_dumps_compact(discovery)
         + "\n\nPlan:\n"
         + plan
     )
-    output = _run_agent(model, system_prompt, user_input, tools=[])
-    parsed = _extract_json_payload(output)
+    output = await _run_agent_async(model, system_prompt, user_input, tools=[], json_shape=_is_spec_payload)
+    parsed = _extract_json_payload(output, _is_spec_payload)
     if not isinstance(parsed, dict):
         return {"prd": output, "gherkin": ""}
     prd = parsed.get("prd", "")
@@ -685,28 +1117,23 @@ def run_specifications(model: ChatOpenAI, discovery: Dict[str, object], plan: st
     return {"prd": prd, "gherkin": gherkin}
 
 
+# Runs of characters that are not str.isalnum() (underscore included).
+_SLUG_SEPARATOR_RE = re.compile(r"[\W_]+")
+
+
 def _slugify(value: str) -> str:
-    safe = []
-    last_dash = False
-    for ch in value.lower():
-        if ch.isalnum():
-            safe.append(ch)
-            last_dash = False
-        elif not last_dash:
-            safe.append("-")
-            last_dash = True
-    slug = "".join(safe).strip("-")
+    slug = _SLUG_SEPARATOR_RE.sub("-", value.lower()).strip("-")
     return slug or "feature"
 
 
-def run_feature_workshops(model: ChatOpenAI, plan: str) -> List[Dict[str, str]]:
+async def run_feature_workshops(model: "ChatOpenAI", plan: str) -> List[Dict[str, str]]:
     system_prompt = (
         "Extract the feature list from the plan. Return JSON array with "
         "objects: {\"title\": \"...\", \"summary\": \"...\"}. "
         "Only include real product features, not process steps."
     )
-    output = _run_agent(model, system_prompt, plan, tools=[])
-    parsed = _extract_json_payload(output)
+    output = await _run_agent_async(model, system_prompt, plan, tools=[], json_shape=_is_feature_list)
+    parsed = _extract_json_payload(output, _is_feature_list)
     if not isinstance(parsed, list):
         return []
     items: List[Dict[str, str]] = []
@@ -720,7 +1147,41 @@ def run_feature_workshops(model: ChatOpenAI, plan: str) -> List[Dict[str, str]]:
     return items
 
 
-def main() -> None:
+async def record_feature_workshops(feature_workshops: List[Dict[str, str]]) -> None:
+    semaphore = asyncio.Semaphore(WORKLINE_CONCURRENCY)
+
+    # Titles that slug to the same task id are handled in order by one coroutine,
+    # so the task is created once instead of racing two POSTs for the same id.
+    by_task: Dict[str, List[Dict[str, str]]] = {}
+    for feature in feature_workshops:
+        by_task.setdefault(f"workshop-feature-{_slugify(feature['title'])}", []).append(feature)
+
+    async def process_features(task_id: str, features: List[Dict[str, str]]) -> None:
+        async with semaphore:
+            for feature in features:
+                summary = feature.get("summary") or "Feature workshop for requirements and Gherkin specs."
+                await aensure_workshop_task(task_id, f"Feature workshop: {feature['title']}", "workshop.clarify", summary)
+                await aset_workshop_output(task_id, summary)
+                await aappend_workshop_conversation(task_id, "Auto-generated from plan", summary)
+
+    await asyncio.gather(*(process_features(task_id, features) for task_id, features in by_task.items()))
+
+
+async def record_refinement_outputs(
+    task_id: str,
+    feature_workshops: List[Dict[str, str]],
+    specs: Dict[str, str],
+) -> None:
+    # Same task: these writes queue behind each other on the task's write lock.
+    if feature_workshops:
+        await aput_task_outcome(task_id, "feature_workshops", feature_workshops)
+    await aput_task_outcome(task_id, "prd", specs.get("prd", ""))
+    await aput_task_outcome(task_id, "gherkin", specs.get("gherkin", ""))
+
+
+async def main() -> None:
+    from langchain_openai import ChatOpenAI
+
     model = ChatOpenAI(model="gpt-4o-mini", temperature=0.2)
     problem_statement = get_problem_statement_from_workline()
     if not problem_statement:
@@ -738,11 +1199,11 @@ def main() -> None:
         set_current_workshop(None)
         set_problem_statement_in_workline(problem_statement)
     discovery = get_problem_refinement_discovery()
-    discovery = continue_discovery(model, problem_statement, discovery)
+    discovery = await continue_discovery(model, problem_statement, discovery)
 
     refinement_task_id = ensure_problem_refinement_task()
 
-    draft_plan = run_planner(model, json.dumps(discovery, indent=2))
+    draft_plan = run_planner(model, _json_dumps_compact(discovery))
     feedback = ask_human_for_review(draft_plan)
     if feedback.lower().startswith("approve"):
         final_plan = draft_plan
@@ -752,47 +1213,52 @@ def main() -> None:
             "Update the plan to address this feedback."
         )
 
-    feature_workshops = run_feature_workshops(model, final_plan)
-    for feature in feature_workshops:
-        slug = _slugify(feature["title"])
-        task_id = f"workshop-feature-{slug}"
-        summary = feature.get("summary") or "Feature workshop for requirements and Gherkin specs."
-        ensure_workshop_task(task_id, f"Feature workshop: {feature['title']}", "workshop.clarify", summary)
-        set_workshop_output(task_id, summary)
-        append_workshop_conversation(task_id, "Auto-generated from plan", summary)
-    if feature_workshops:
-        client.put_work_outcomes(refinement_task_id, "feature_workshops", feature_workshops)
-
-    specs = run_specifications(model, discovery, final_plan)
-    client.put_work_outcomes(refinement_task_id, "prd", specs.get("prd", ""))
-    client.put_work_outcomes(refinement_task_id, "gherkin", specs.get("gherkin", ""))
-
+    # Specs and feature extraction only need the plan, so both model calls run
+    # at once; feature workshops are recorded while the specs are still coming.
+    spec_task = asyncio.create_task(run_specifications(model, discovery, final_plan))
+    feature_workshops = await run_feature_workshops(model, final_plan)
+    feature_writes = asyncio.create_task(record_feature_workshops(feature_workshops))
+    specs = await spec_task
     iteration_id = _extract_iteration_id(final_plan)
     existing_tasks = None
+    # The iteration task listing does not depend on the write-back, so the read
+    # runs on a worker thread while the outcome writes are in flight.
+    pending_calls: List[Awaitable[object]] = [
+        feature_writes,
+        record_refinement_outputs(refinement_task_id, feature_workshops, specs),
+    ]
+    if iteration_id:
+        pending_calls.append(asyncio.to_thread(_list_iteration_tasks_for_context, iteration_id))
+    results = await asyncio.gather(*pending_calls)
     if iteration_id:
-        existing_tasks = _list_iteration_tasks_for_context(iteration_id)
+        existing_tasks = results[-1]
     execution_context = final_plan
     if existing_tasks is not None:
         execution_context = (
             f"{final_plan}\n\nExisting tasks for iteration {iteration_id}:\n"
-            + json.dumps(existing_tasks, indent=2)
+            + _json_dumps_compact(existing_tasks)
         )
     result = run_workline(model, execution_context)
 
-    print(
-        json.dumps(
-            {
-                "discovery": discovery,
-                "problem_refinement_task_id": refinement_task_id,
-                "plan": final_plan,
-                "prd": specs.get("prd", ""),
-                "gherkin": specs.get("gherkin", ""),
-                "workline": result,
-            },
-            indent=2,
-        )
+    _print_json(
+        {
+            "discovery": discovery,
+            "problem_refinement_task_id": refinement_task_id,
+            "plan": final_plan,
+            "prd": specs.get("prd", ""),
+            "gherkin": specs.get("gherkin", ""),
+            "workline": result,
+        }
     )
 
 
+async def _run() -> None:
+    try:
+        await main()
+    finally:
+        await async_client.aclose()
+        _SHARED_SESSION.close()
+
+
 if __name__ == "__main__":
-    main()
+    asyncio.run(_run())
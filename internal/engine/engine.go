@@ -1010,47 +1010,82 @@ func (e Engine) CreateDecision(ctx context.Context, d domain.Decision, actorID s
 
 // AddAttestation inserts attestation and event.
 func (e Engine) AddAttestation(ctx context.Context, att domain.Attestation, actorID string) (domain.Attestation, error) {
-	if e.Config == nil {
-		return att, errors.New("config not loaded")
+	res, err := e.AddAttestations(ctx, []domain.Attestation{att}, actorID)
+	if err != nil {
+		return att, err
 	}
-	if att.EntityKind == "" || att.EntityID == "" || att.Kind == "" {
-		return att, errors.New("entity-kind, entity-id and kind required")
+	return res[0], nil
+}
+
+// AddAttestations inserts several attestations and their events in one
+// transaction: either all of them are recorded or none are.
+func (e Engine) AddAttestations(ctx context.Context, atts []domain.Attestation, actorID string) ([]domain.Attestation, error) {
+	if e.Config == nil {
+		return nil, errors.New("config not loaded")
 	}
-	att.ID = uuid.New().String()
-	if att.TS == "" {
-		att.TS = e.now().UTC().Format(time.RFC3339)
+	if len(atts) == 0 {
+		return nil, errors.New("at least one attestation required")
 	}
-	if att.ProjectID == "" {
-		return att, errors.New("project required")
+	now := e.now().UTC().Format(time.RFC3339)
+	res := make([]domain.Attestation, len(atts))
+	for i, att := range atts {
+		if att.EntityKind == "" || att.EntityID == "" || att.Kind == "" {
+			return nil, errors.New("entity-kind, entity-id and kind required")
+		}
+		if att.ProjectID == "" {
+			return nil, errors.New("project required")
+		}
+		att.ID = uuid.New().String()
+		if att.TS == "" {
+			att.TS = now
+		}
+		res[i] = att
 	}
-	if _, err := e.Repo.GetProject(ctx, att.ProjectID); err != nil {
-		return att, err
+	projects := map[string]bool{}
+	for _, att := range res {
+		if projects[att.ProjectID] {
+			continue
+		}
+		if _, err := e.Repo.GetProject(ctx, att.ProjectID); err != nil {
+			return nil, err
+		}
+		projects[att.ProjectID] = true
 	}
 	tx, err := e.DB.BeginTx(ctx, nil)
 	if err != nil {
-		return att, err
+		return nil, err
 	}
 	defer tx.Rollback()
-	if err := e.requirePermission(ctx, tx, att.ProjectID, actorID, "attestation.add"); err != nil {
-		return att, err
-	}
-	if err := e.requireAttestationAuthority(ctx, tx, att.ProjectID, actorID, att.Kind); err != nil {
-		return att, err
-	}
-	if err := e.Repo.InsertAttestationTx(ctx, tx, att); err != nil {
-		return att, err
-	}
-	if err := e.Events.Append(ctx, tx, "attestation.added", att.ProjectID, att.EntityKind, att.EntityID, actorID, events.EventPayload{
-		"kind":           att.Kind,
-		"entity":         att.EntityID,
-		"attestation_id": att.ID,
-	}); err != nil {
-		return att, err
+	permitted := map[string]bool{}
+	authorized := map[[2]string]bool{}
+	for _, att := range res {
+		if !permitted[att.ProjectID] {
+			if err := e.requirePermission(ctx, tx, att.ProjectID, actorID, "attestation.add"); err != nil {
+				return nil, err
+			}
+			permitted[att.ProjectID] = true
+		}
+		if key := [2]string{att.ProjectID, att.Kind}; !authorized[key] {
+			if err := e.requireAttestationAuthority(ctx, tx, att.ProjectID, actorID, att.Kind); err != nil {
+				return nil, err
+			}
+			authorized[key] = true
+		}
+		if err := e.Repo.InsertAttestationTx(ctx, tx, att); err != nil {
+			return nil, err
+		}
+		if err := e.Events.Append(ctx, tx, "attestation.added", att.ProjectID, att.EntityKind, att.EntityID, actorID, events.EventPayload{
+			"kind":           att.Kind,
+			"entity":         att.EntityID,
+			"attestation_id": att.ID,
+		}); err != nil {
+			return nil, err
+		}
 	}
 	if err := tx.Commit(); err != nil {
-		return att, err
+		return nil, err
 	}
-	return att, nil
+	return res, nil
 }
 
 func (e Engine) ensureTaskPolicySatisfied(ctx context.Context, t domain.Task) (bool, error) {
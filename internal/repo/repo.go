@@ -374,6 +374,7 @@ type TaskFilters struct {
 	Iteration       string
 	Parent          string
 	AssigneeID      string
+	Type            string
 	Limit           int
 	CursorCreatedAt string
 	CursorID        string
@@ -409,6 +410,10 @@ func (r Repo) ListTasks(ctx context.Context, f TaskFilters) ([]domain.Task, erro
 		clauses = append(clauses, "assignee_id=?")
 		args = append(args, f.AssigneeID)
 	}
+	if f.Type != "" {
+		clauses = append(clauses, "type=?")
+		args = append(args, f.Type)
+	}
 	if f.CursorCreatedAt != "" && f.CursorID != "" {
 		clauses = append(clauses, "(created_at < ? OR (created_at = ? AND id < ?))")
 		args = append(args, f.CursorCreatedAt, f.CursorCreatedAt, f.CursorID)
@@ -773,10 +778,16 @@ func (r Repo) LatestRunningIteration(ctx context.Context, projectID string) (*do
 }
 
 func (r Repo) LatestEvents(ctx context.Context, limit int, projectID, evtType, entityKind, entityID string) ([]domain.Event, error) {
-	return r.LatestEventsFrom(ctx, limit, 0, projectID, evtType, entityKind, entityID)
+	var entityIDs []string
+	if entityID != "" {
+		entityIDs = []string{entityID}
+	}
+	return r.LatestEventsFrom(ctx, limit, 0, projectID, evtType, entityKind, entityIDs)
 }
 
-func (r Repo) LatestEventsFrom(ctx context.Context, limit int, cursor int64, projectID, evtType, entityKind, entityID string) ([]domain.Event, error) {
+// LatestEventsFrom returns events older than the cursor, newest first. A
+// non-empty entityIDs restricts the result to events on any of those entities.
+func (r Repo) LatestEventsFrom(ctx context.Context, limit int, cursor int64, projectID, evtType, entityKind string, entityIDs []string) ([]domain.Event, error) {
 	clauses := []string{"1=1"}
 	var args []any
 	if projectID != "" {
@@ -791,9 +802,16 @@ func (r Repo) LatestEventsFrom(ctx context.Context, limit int, cursor int64, pro
 		clauses = append(clauses, "entity_kind=?")
 		args = append(args, entityKind)
 	}
-	if entityID != "" {
+	switch len(entityIDs) {
+	case 0:
+	case 1:
 		clauses = append(clauses, "entity_id=?")
-		args = append(args, entityID)
+		args = append(args, entityIDs[0])
+	default:
+		clauses = append(clauses, "entity_id IN (?"+strings.Repeat(",?", len(entityIDs)-1)+")")
+		for _, id := range entityIDs {
+			args = append(args, id)
+		}
 	}
 	if cursor > 0 {
 		clauses = append(clauses, "id<?")
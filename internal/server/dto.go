@@ -131,6 +131,10 @@ type CreateAttestationRequest struct {
 	Payload    map[string]any `json:"payload,omitempty" example:"{\"note\":\"LGTM\"}"`
 }
 
+type CreateAttestationsRequest struct {
+	Items []CreateAttestationRequest `json:"items" minItems:"1" maxItems:"200"`
+}
+
 type ActorMissionRequest struct {
 	Mission string `json:"mission"`
 }
@@ -303,6 +307,10 @@ type paginatedAttestations struct {
 	NextCursor string                `json:"next_cursor,omitempty"`
 }
 
+type attestationBatch struct {
+	Items []AttestationResponse `json:"items"`
+}
+
 type paginatedEvents struct {
 	Items      []EventResponse `json:"items"`
 	NextCursor string          `json:"next_cursor,omitempty"`
@@ -2,7 +2,10 @@ package server
 
 import (
 	"bytes"
+	"compress/gzip"
 	"context"
+	"crypto/sha256"
+	"encoding/hex"
 	"encoding/json"
 	"errors"
 	"fmt"
@@ -15,6 +18,7 @@ import (
 	"github.com/danielgtaylor/huma/v2"
 	humachi "github.com/danielgtaylor/huma/v2/adapters/humachi"
 	"github.com/go-chi/chi/v5"
+	"github.com/go-chi/chi/v5/middleware"
 
 	"workline/internal/config"
 	"workline/internal/domain"
@@ -75,9 +79,16 @@ func New(cfg Config) (http.Handler, error) {
 	}
 
 	router := chi.NewRouter()
+	// gzip/deflate responses for clients that send Accept-Encoding.
+	router.Use(middleware.Compress(5))
+	router.Use(conditionalGET)
 	router.Use(func(next http.Handler) http.Handler {
 		return http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-			bodyBytes, _ := io.ReadAll(r.Body)
+			bodyBytes, err := readRequestBody(r)
+			if err != nil {
+				respondStatusError(w, newAPIError(http.StatusBadRequest, "bad_request", "invalid gzip body", map[string]any{"error": err.Error()}))
+				return
+			}
 			r.Body = io.NopCloser(bytes.NewBuffer(bodyBytes))
 			ctx := context.WithValue(r.Context(), requestKey{}, r)
 			ctx = context.WithValue(ctx, bodyBytesKey{}, bodyBytes)
@@ -111,6 +122,83 @@ func New(cfg Config) (http.Handler, error) {
 	return router, nil
 }
 
+// bufferedResponse holds a handler's response so a digest of the body can be
+// sent as a header before the body itself.
+type bufferedResponse struct {
+	header http.Header
+	status int
+	body   bytes.Buffer
+}
+
+func (b *bufferedResponse) Header() http.Header { return b.header }
+
+func (b *bufferedResponse) WriteHeader(status int) { b.status = status }
+
+func (b *bufferedResponse) Write(p []byte) (int, error) { return b.body.Write(p) }
+
+// conditionalGET tags successful GET responses with a weak ETag and answers
+// 304 Not Modified when If-None-Match already names it. The handler still runs;
+// the client is spared the transfer and the re-parse of an unchanged body.
+func conditionalGET(next http.Handler) http.Handler {
+	return http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.Method != http.MethodGet {
+			next.ServeHTTP(w, r)
+			return
+		}
+		rec := &bufferedResponse{header: w.Header(), status: http.StatusOK}
+		next.ServeHTTP(rec, r)
+		if rec.status == http.StatusOK {
+			sum := sha256.Sum256(rec.body.Bytes())
+			etag := `W/"` + hex.EncodeToString(sum[:16]) + `"`
+			w.Header().Set("ETag", etag)
+			if etagMatches(r.Header.Get("If-None-Match"), etag) {
+				w.Header().Del("Content-Length")
+				w.WriteHeader(http.StatusNotModified)
+				return
+			}
+		}
+		w.WriteHeader(rec.status)
+		_, _ = w.Write(rec.body.Bytes())
+	})
+}
+
+func etagMatches(ifNoneMatch, etag string) bool {
+	for _, candidate := range strings.Split(ifNoneMatch, ",") {
+		candidate = strings.TrimSpace(candidate)
+		if candidate == "*" || strings.TrimPrefix(candidate, "W/") == strings.TrimPrefix(etag, "W/") {
+			return true
+		}
+	}
+	return false
+}
+
+// maxDecodedBodyBytes caps gzip-encoded request bodies once inflated.
+const maxDecodedBodyBytes = 32 << 20
+
+// readRequestBody reads the whole request body, inflating it when the client
+// sent Content-Encoding: gzip so handlers always see plain JSON.
+func readRequestBody(r *http.Request) ([]byte, error) {
+	if !strings.EqualFold(r.Header.Get("Content-Encoding"), "gzip") {
+		body, _ := io.ReadAll(r.Body)
+		return body, nil
+	}
+	zr, err := gzip.NewReader(r.Body)
+	if err != nil {
+		return nil, err
+	}
+	defer zr.Close()
+	body, err := io.ReadAll(io.LimitReader(zr, maxDecodedBodyBytes+1))
+	if err != nil {
+		return nil, err
+	}
+	if len(body) > maxDecodedBodyBytes {
+		return nil, errors.New("decoded body too large")
+	}
+	r.Header.Del("Content-Encoding")
+	r.ContentLength = int64(len(body))
+	return body, nil
+}
+
 func newAPIError(status int, code, message string, details map[string]any) huma.StatusError {
 	if code == "" {
 		code = defaultCodeForStatus(status)
@@ -710,6 +798,7 @@ func registerTasks(api huma.API, e engine.Engine) {
 		IterationID string `query:"iteration_id"`
 		ParentID    string `query:"parent_id"`
 		AssigneeID  string `query:"assignee_id"`
+		Type        string `query:"type"`
 		Limit       int    `query:"limit" default:"50"`
 		Cursor      string `query:"cursor"`
 	}) (*struct {
@@ -730,6 +819,7 @@ func registerTasks(api huma.API, e engine.Engine) {
 			Iteration:       input.IterationID,
 			Parent:          input.ParentID,
 			AssigneeID:      input.AssigneeID,
+			Type:            input.Type,
 			Limit:           limit + 1,
 			CursorCreatedAt: cursorCreated,
 			CursorID:        cursorID,
@@ -1937,28 +2027,10 @@ func registerAttestations(api huma.API, e engine.Engine) {
 		if authErr != nil {
 			return nil, authErr
 		}
-		if input.Body.EntityKind == "" || input.Body.EntityID == "" || input.Body.Kind == "" {
-			return nil, newAPIError(http.StatusBadRequest, "bad_request", "entity_kind, entity_id and kind are required", nil)
-		}
 		projectID := projectFromPathOrHeader(ctx, input.ProjectID, e.Config.Project.ID)
-		payload := ""
-		if input.Body.Payload != nil {
-			b, err := json.Marshal(input.Body.Payload)
-			if err != nil {
-				return nil, newAPIError(http.StatusBadRequest, "bad_request", "invalid payload", map[string]any{"error": err.Error()})
-			}
-			payload = string(b)
-		}
-		att := domain.Attestation{
-			ID:          strPtrValue(input.Body.ID),
-			ProjectID:   projectID,
-			EntityKind:  input.Body.EntityKind,
-			EntityID:    input.Body.EntityID,
-			Kind:        input.Body.Kind,
-			PayloadJSON: payload,
-		}
-		if input.Body.TS != nil {
-			att.TS = *input.Body.TS
+		att, apiErr := attestationFromRequest(projectID, input.Body)
+		if apiErr != nil {
+			return nil, apiErr
 		}
 		res, err := e.AddAttestation(ctx, att, actorID)
 		if err != nil {
@@ -1969,6 +2041,55 @@ func registerAttestations(api huma.API, e engine.Engine) {
 		}{Body: attestationResponse(res)}, nil
 	})
 
+	huma.Register(api, huma.Operation{
+		OperationID:   "add-attestations",
+		Method:        http.MethodPost,
+		Path:          "/projects/{project_id}/attestations/batch",
+		Summary:       "Add attestations in one transaction",
+		DefaultStatus: http.StatusCreated,
+		Errors: []int{
+			http.StatusBadRequest,
+			http.StatusForbidden,
+			http.StatusNotFound,
+			http.StatusConflict,
+			http.StatusUnprocessableEntity,
+			http.StatusInternalServerError,
+		},
+	}, func(ctx context.Context, input *struct {
+		ProjectID string                    `path:"project_id"`
+		Body      CreateAttestationsRequest `json:"body"`
+	}) (*struct {
+		Body attestationBatch `json:"body"`
+	}, error) {
+		if len(bodyBytes(ctx)) == 0 {
+			return nil, newAPIError(http.StatusBadRequest, "bad_request", "body required", nil)
+		}
+		actorID, authErr := actorIDFromContext(ctx)
+		if authErr != nil {
+			return nil, authErr
+		}
+		projectID := projectFromPathOrHeader(ctx, input.ProjectID, e.Config.Project.ID)
+		atts := make([]domain.Attestation, 0, len(input.Body.Items))
+		for i, item := range input.Body.Items {
+			att, apiErr := attestationFromRequest(projectID, item)
+			if apiErr != nil {
+				return nil, newAPIError(apiErr.GetStatus(), "bad_request", apiErr.Error(), map[string]any{"index": i})
+			}
+			atts = append(atts, att)
+		}
+		res, err := e.AddAttestations(ctx, atts, actorID)
+		if err != nil {
+			return nil, handleError(err)
+		}
+		resp := attestationBatch{Items: make([]AttestationResponse, 0, len(res))}
+		for _, att := range res {
+			resp.Items = append(resp.Items, attestationResponse(att))
+		}
+		return &struct {
+			Body attestationBatch `json:"body"`
+		}{Body: resp}, nil
+	})
+
 	huma.Register(api, huma.Operation{
 		OperationID: "list-attestations",
 		Method:      http.MethodGet,
@@ -2021,6 +2142,36 @@ func registerAttestations(api huma.API, e engine.Engine) {
 	})
 }
 
+func attestationFromRequest(projectID string, req CreateAttestationRequest) (domain.Attestation, huma.StatusError) {
+	if req.EntityKind == "" || req.EntityID == "" || req.Kind == "" {
+		return domain.Attestation{}, newAPIError(http.StatusBadRequest, "bad_request", "entity_kind, entity_id and kind are required", nil)
+	}
+	payload := ""
+	if req.Payload != nil {
+		b, err := json.Marshal(req.Payload)
+		if err != nil {
+			return domain.Attestation{}, newAPIError(http.StatusBadRequest, "bad_request", "invalid payload", map[string]any{"error": err.Error()})
+		}
+		payload = string(b)
+	}
+	att := domain.Attestation{
+		ID:          strPtrValue(req.ID),
+		ProjectID:   projectID,
+		EntityKind:  req.EntityKind,
+		EntityID:    req.EntityID,
+		Kind:        req.Kind,
+		PayloadJSON: payload,
+	}
+	if req.TS != nil {
+		att.TS = *req.TS
+	}
+	return att, nil
+}
+
+// maxEventEntityIDs bounds the entity_ids filter of list-events so the query
+// stays well under SQLite's bound-parameter limit.
+const maxEventEntityIDs = 200
+
 func registerEvents(api huma.API, e engine.Engine) {
 	huma.Register(api, huma.Operation{
 		OperationID: "list-events",
@@ -2033,6 +2184,7 @@ func registerEvents(api huma.API, e engine.Engine) {
 		Type       string `query:"type"`
 		EntityKind string `query:"entity_kind" enum:"project,iteration,task,decision,rbac"`
 		EntityID   string `query:"entity_id"`
+		EntityIDs  string `query:"entity_ids"`
 		Limit      int    `query:"limit" default:"50"`
 		Cursor     string `query:"cursor"`
 	}) (*struct {
@@ -2051,7 +2203,19 @@ func registerEvents(api huma.API, e engine.Engine) {
 			}
 			cursorID = parsed
 		}
-		items, err := e.Repo.LatestEventsFrom(ctx, limit+1, cursorID, projectID, input.Type, input.EntityKind, input.EntityID)
+		var entityIDs []string
+		if input.EntityID != "" {
+			entityIDs = append(entityIDs, input.EntityID)
+		}
+		for _, id := range strings.Split(input.EntityIDs, ",") {
+			if id = strings.TrimSpace(id); id != "" {
+				entityIDs = append(entityIDs, id)
+			}
+		}
+		if len(entityIDs) > maxEventEntityIDs {
+			return nil, newAPIError(http.StatusBadRequest, "bad_request", "too many entity_ids", map[string]any{"max": maxEventEntityIDs})
+		}
+		items, err := e.Repo.LatestEventsFrom(ctx, limit+1, cursorID, projectID, input.Type, input.EntityKind, entityIDs)
 		if err != nil {
 			return nil, handleError(err)
 		}
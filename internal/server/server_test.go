@@ -2,6 +2,7 @@ package server
 
 import (
 	"bytes"
+	"compress/gzip"
 	"context"
 	"encoding/json"
 	"fmt"
@@ -1247,3 +1248,200 @@ func TestPaginationProvidesCursor(t *testing.T) {
 		t.Fatalf("expected next_cursor to be set")
 	}
 }
+
+func TestListTasksFiltersByType(t *testing.T) {
+	srv, cleanup := newTestServer(t)
+	defer cleanup()
+	projectID := "workline"
+	client := srv.Client()
+
+	for _, taskType := range []string{"docs", "technical", "docs"} {
+		res, body := doJSON(t, client, http.MethodPost, srv.URL+"/v0/projects/"+projectID+"/tasks", map[string]any{
+			"title": "Task " + taskType,
+			"type":  taskType,
+		}, nil)
+		if res.StatusCode != http.StatusCreated {
+			t.Fatalf("create %s task: %d %s", taskType, res.StatusCode, string(body))
+		}
+	}
+
+	res, data := doJSON(t, client, http.MethodGet, srv.URL+"/v0/projects/"+projectID+"/tasks?type=docs", nil, nil)
+	if res.StatusCode != http.StatusOK {
+		t.Fatalf("list tasks: %d %s", res.StatusCode, string(data))
+	}
+	var page paginatedTasks
+	if err := json.Unmarshal(data, &page); err != nil {
+		t.Fatalf("unmarshal page: %v", err)
+	}
+	if len(page.Items) != 2 {
+		t.Fatalf("expected 2 docs tasks, got %d", len(page.Items))
+	}
+	for _, item := range page.Items {
+		if item.Type != "docs" {
+			t.Fatalf("expected only docs tasks, got %q", item.Type)
+		}
+	}
+}
+
+func TestAddAttestationsBatchAndEventsByEntityIDs(t *testing.T) {
+	srv, cleanup := newTestServer(t)
+	defer cleanup()
+	projectID := "workline"
+	client := srv.Client()
+
+	var taskIDs []string
+	for _, title := range []string{"First", "Second", "Third"} {
+		res, data := doJSON(t, client, http.MethodPost, srv.URL+"/v0/projects/"+projectID+"/tasks", map[string]any{
+			"title": title,
+			"type":  "technical",
+		}, nil)
+		if res.StatusCode != http.StatusCreated {
+			t.Fatalf("create task: %d %s", res.StatusCode, string(data))
+		}
+		var task TaskResponse
+		_ = json.Unmarshal(data, &task)
+		taskIDs = append(taskIDs, task.ID)
+	}
+
+	batchRes, batchData := doJSON(t, client, http.MethodPost, srv.URL+"/v0/projects/"+projectID+"/attestations/batch", map[string]any{
+		"items": []map[string]any{
+			{"entity_kind": "task", "entity_id": taskIDs[0], "kind": "ci.passed"},
+			{"entity_kind": "task", "entity_id": taskIDs[1], "kind": "review.approved"},
+			{"entity_kind": "task", "entity_id": taskIDs[2], "kind": "ci.passed"},
+		},
+	}, nil)
+	if batchRes.StatusCode != http.StatusCreated {
+		t.Fatalf("batch attestations: %d %s", batchRes.StatusCode, string(batchData))
+	}
+	var batch attestationBatch
+	if err := json.Unmarshal(batchData, &batch); err != nil {
+		t.Fatalf("unmarshal batch: %v", err)
+	}
+	if len(batch.Items) != 3 {
+		t.Fatalf("expected 3 attestations, got %d", len(batch.Items))
+	}
+	if batch.Items[1].EntityID != taskIDs[1] || batch.Items[1].Kind != "review.approved" {
+		t.Fatalf("batch response out of order: %+v", batch.Items[1])
+	}
+
+	badRes, badData := doJSON(t, client, http.MethodPost, srv.URL+"/v0/projects/"+projectID+"/attestations/batch", map[string]any{
+		"items": []map[string]any{
+			{"entity_kind": "task", "entity_id": taskIDs[0], "kind": "acceptance.passed"},
+			{"entity_kind": "task", "entity_id": taskIDs[0]},
+		},
+	}, nil)
+	if badRes.StatusCode != http.StatusBadRequest {
+		t.Fatalf("expected 400 for incomplete item, got %d: %s", badRes.StatusCode, string(badData))
+	}
+
+	evRes, evData := doJSON(t, client, http.MethodGet, srv.URL+"/v0/projects/"+projectID+"/events?type=attestation.added&entity_ids="+taskIDs[0]+","+taskIDs[1], nil, nil)
+	if evRes.StatusCode != http.StatusOK {
+		t.Fatalf("list events: %d %s", evRes.StatusCode, string(evData))
+	}
+	var page paginatedEvents
+	if err := json.Unmarshal(evData, &page); err != nil {
+		t.Fatalf("unmarshal events: %v", err)
+	}
+	if len(page.Items) != 2 {
+		t.Fatalf("expected 2 attestation events, got %d", len(page.Items))
+	}
+	for _, evt := range page.Items {
+		if evt.EntityID != taskIDs[0] && evt.EntityID != taskIDs[1] {
+			t.Fatalf("unexpected entity in events: %s", evt.EntityID)
+		}
+	}
+}
+
+func TestGzipRequestAndResponseBodies(t *testing.T) {
+	srv, cleanup := newTestServer(t)
+	defer cleanup()
+	projectID := "workline"
+	client := srv.Client()
+
+	var compressed bytes.Buffer
+	zw := gzip.NewWriter(&compressed)
+	if err := json.NewEncoder(zw).Encode(map[string]any{"title": "Compressed", "type": "technical"}); err != nil {
+		t.Fatalf("encode body: %v", err)
+	}
+	if err := zw.Close(); err != nil {
+		t.Fatalf("close gzip writer: %v", err)
+	}
+	req, err := http.NewRequest(http.MethodPost, srv.URL+"/v0/projects/"+projectID+"/tasks", &compressed)
+	if err != nil {
+		t.Fatalf("new request: %v", err)
+	}
+	req.Header.Set("Content-Type", "application/json")
+	req.Header.Set("Content-Encoding", "gzip")
+	if v, ok := clientAuth.Load(client); ok {
+		if auth := v.(authContext); auth.bearerToken != "" {
+			req.Header.Set("Authorization", "Bearer "+auth.bearerToken)
+		} else if auth.apiKey != "" {
+			req.Header.Set("X-Api-Key", auth.apiKey)
+		}
+	}
+	res, err := client.Do(req)
+	if err != nil {
+		t.Fatalf("do request: %v", err)
+	}
+	data, _ := io.ReadAll(res.Body)
+	res.Body.Close()
+	if res.StatusCode != http.StatusCreated {
+		t.Fatalf("create gzip task: %d %s", res.StatusCode, string(data))
+	}
+	var task TaskResponse
+	if err := json.Unmarshal(data, &task); err != nil {
+		t.Fatalf("unmarshal task: %v", err)
+	}
+	if task.Title != "Compressed" {
+		t.Fatalf("unexpected title %q", task.Title)
+	}
+
+	// The default transport asks for gzip and marks responses it inflated.
+	listRes, listData := doJSON(t, client, http.MethodGet, srv.URL+"/v0/projects/"+projectID+"/tasks", nil, nil)
+	if listRes.StatusCode != http.StatusOK {
+		t.Fatalf("list tasks: %d %s", listRes.StatusCode, string(listData))
+	}
+	if !listRes.Uncompressed {
+		t.Fatalf("expected a gzip-encoded response")
+	}
+}
+
+func TestConditionalGetReturnsNotModified(t *testing.T) {
+	srv, cleanup := newTestServer(t)
+	defer cleanup()
+	projectID := "workline"
+	client := srv.Client()
+	listURL := srv.URL + "/v0/projects/" + projectID + "/tasks"
+
+	res, data := doJSON(t, client, http.MethodGet, listURL, nil, nil)
+	if res.StatusCode != http.StatusOK {
+		t.Fatalf("list tasks: %d %s", res.StatusCode, string(data))
+	}
+	etag := res.Header.Get("ETag")
+	if etag == "" {
+		t.Fatalf("expected an ETag on list tasks")
+	}
+
+	res, data = doJSON(t, client, http.MethodGet, listURL, nil, map[string]string{"If-None-Match": etag})
+	if res.StatusCode != http.StatusNotModified {
+		t.Fatalf("expected 304, got %d: %s", res.StatusCode, string(data))
+	}
+	if len(data) != 0 {
+		t.Fatalf("expected empty 304 body, got %q", string(data))
+	}
+
+	createRes, createData := doJSON(t, client, http.MethodPost, listURL, map[string]any{
+		"title": "Changes the list",
+		"type":  "technical",
+	}, nil)
+	if createRes.StatusCode != http.StatusCreated {
+		t.Fatalf("create task: %d %s", createRes.StatusCode, string(createData))
+	}
+	res, data = doJSON(t, client, http.MethodGet, listURL, nil, map[string]string{"If-None-Match": etag})
+	if res.StatusCode != http.StatusOK {
+		t.Fatalf("expected 200 after a change, got %d: %s", res.StatusCode, string(data))
+	}
+	if res.Header.Get("ETag") == etag {
+		t.Fatalf("expected a new ETag after a change")
+	}
+}
@@ -1,12 +1,76 @@
+import asyncio
+import gzip
+import importlib.util
 import json
+import sys
+import threading
 import urllib.parse
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used instead
+    orjson = None
 
-@dataclass
+try:
+    import ijson
+except ImportError:  # optional: iter_events falls back to one full parse
+    ijson = None
+
+try:
+    import httpx
+except ImportError:  # only needed by AsyncWorklineClient
+    httpx = None
+
+# Connection pool sizing for sessions built by create_session(). Retries cover
+# connection errors and gateway statuses on idempotent methods only (urllib3's
+# default allowed_methods), so POSTs are never replayed.
+SESSION_POOL_CONNECTIONS = 32
+SESSION_POOL_MAXSIZE = 64
+SESSION_RETRY = Retry(total=3, backoff_factor=0.1, status_forcelist=(502, 503, 504), raise_on_status=False)
+
+# Connection pool sizing for AsyncWorklineClient when no client is injected.
+DEFAULT_ASYNC_LIMITS = (
+    httpx.Limits(max_connections=100, max_keepalive_connections=50) if httpx is not None else None
+)
+# HTTP/2 (one multiplexed connection for concurrent calls) needs httpx[http2];
+# httpx negotiates it over TLS and falls back to HTTP/1.1 otherwise.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Request bodies larger than this are sent gzip-compressed (the server inflates
+# Content-Encoding: gzip). Responses are negotiated by requests/httpx, which
+# already advertise and decode gzip.
+GZIP_MIN_BODY_BYTES = 2048
+
+# Path segments (ids) are percent-encoded with this, safe='' so "/" is escaped.
+_Q = urllib.parse.quote
+
+# Most items the attestations batch endpoint accepts in one request
+# (CreateAttestationsRequest maxItems); larger batches are rejected with a 400.
+ATTESTATION_BATCH_MAX = 200
+
+# Error responses keep at most this many leading bytes of their body.
+MAX_ERROR_BODY_BYTES = 4096
+
+# Default number of GET responses remembered per client for If-None-Match
+# revalidation (the etag_cache_size constructor option; 0 disables it). The
+# oldest entry is dropped beyond this.
+ETAG_CACHE_SIZE = 256
+
+T = TypeVar("T")
+
+# Response records are immutable and slotted (no per-instance __dict__) where
+# the interpreter supports it (Python 3.10+).
+_RECORD = {"slots": True, "frozen": True} if sys.version_info >= (3, 10) else {"frozen": True}
+
+
+@dataclass(**_RECORD)
 class Task:
     id: str
     project_id: str
@@ -15,7 +79,7 @@ class Task:
     status: str
 
 
-@dataclass
+@dataclass(**_RECORD)
 class Attestation:
     id: str
     project_id: str
@@ -27,7 +91,7 @@ class Attestation:
     payload: Any = None
 
 
-@dataclass
+@dataclass(**_RECORD)
 class Event:
     id: int
     ts: Optional[str]
@@ -64,14 +128,69 @@ class ActorProfile:
     roles: List[str]
 
 
+def _task(data: Dict[str, Any]) -> Task:
+    return Task(
+        id=data["id"],
+        project_id=data["project_id"],
+        title=data["title"],
+        type=data["type"],
+        status=data["status"],
+    )
+
+
+def _attestation(data: Dict[str, Any]) -> Attestation:
+    return Attestation(
+        id=data["id"],
+        project_id=data["project_id"],
+        entity_kind=data["entity_kind"],
+        entity_id=data["entity_id"],
+        kind=data["kind"],
+        actor_id=data["actor_id"],
+        ts=data.get("ts"),
+        payload=data.get("payload"),
+    )
+
+
+# Event's fields in declaration order, for positional construction (no kwargs
+# dict per row on large event pages).
+_EVENT_FIELDS = ("id", "ts", "type", "project_id", "entity_kind", "entity_id", "actor_id", "payload")
+
+
+def _event(item: Dict[str, Any]) -> Event:
+    return Event(*[item.get(field) for field in _EVENT_FIELDS])
+
+
+def _attestation_item(entity_kind: str, entity_id: str, kind: str, payload: Any = None) -> Dict[str, Any]:
+    item: Dict[str, Any] = {"entity_kind": entity_kind, "entity_id": entity_id, "kind": kind}
+    if payload is not None:
+        item["payload"] = payload
+    return item
+
+
 class APIError(RuntimeError):
-    def __init__(self, status_code: int, body: Any):
-        super().__init__(f"API error {status_code}: {body}")
+    # The body is decoded from the raw bytes on first access and the message is
+    # only formatted when printed, so caught-and-ignored errors stay cheap.
+    def __init__(self, status_code: int, body: Any = None, raw: Optional[bytes] = None):
+        super().__init__(status_code)
         self.status_code = status_code
-        self.body = body
+        self._body = body
+        self._raw = raw
+
+    @property
+    def body(self) -> Any:
+        if self._raw is not None:
+            try:
+                self._body = _decode_body(self._raw)
+            except ValueError:
+                self._body = self._raw.decode("utf-8", errors="replace")
+            self._raw = None
+        return self._body
 
+    def __str__(self) -> str:
+        return f"API error {self.status_code}: {self.body}"
 
-class WorklineClient:
+
+class _BaseClient:
     def __init__(
         self,
         base_url: str,
@@ -79,83 +198,308 @@ class WorklineClient:
         actor_id: Optional[str] = None,
         api_key: Optional[str] = None,
         access_token: Optional[str] = None,
-        session: Optional[requests.Session] = None,
         timeout: float = 10.0,
+        etag_cache_size: int = ETAG_CACHE_SIZE,
     ):
         self.base_url = base_url.rstrip("/")
         self.project_id = project_id
         self.actor_id = actor_id
-        self.api_key = api_key
-        self.access_token = access_token
-        self.session = session or requests.Session()
+        self._api_key = api_key
+        self._access_token = access_token
         self.timeout = timeout
+        # Every URL shares this prefix; build it once rather than urljoin per call.
+        self._project_prefix = f"{self.base_url}/v0/projects/{_Q(project_id, safe='')}/"
+        self._events_base = self._project_prefix + "events"
+        # Built once and shared by every request (requests/httpx never mutate the
+        # dict they are given); rebuilt when api_key or access_token is set.
+        self._default_headers = self._headers()
+        # GET URL -> (ETag, raw body bytes). On 304 Not Modified the bytes are
+        # decoded again, so every call returns fresh objects. Clients hold a
+        # single actor's credentials, so entries never leak across actors.
+        self._etag_cache_size = etag_cache_size
+        self._etag_cache: Dict[str, Tuple[str, bytes]] = {}
+        self._etag_lock = threading.Lock()
+
+    @property
+    def api_key(self) -> Optional[str]:
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value: Optional[str]) -> None:
+        self._api_key = value
+        self._credentials_changed()
+
+    @property
+    def access_token(self) -> Optional[str]:
+        """Bearer token sent instead of api_key; assign a new one to rotate it."""
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, value: Optional[str]) -> None:
+        self._access_token = value
+        self._credentials_changed()
+
+    def _credentials_changed(self) -> None:
+        # Cached GET bodies belong to the previous credentials' actor.
+        self._default_headers = self._headers()
+        self.invalidate()
+
+    def invalidate(self, url_prefix: str = "") -> None:
+        """Drop cached GET responses whose URL starts with url_prefix (all when empty).
+
+        Relative prefixes such as "tasks/" are taken from the project path.
+        """
+        if url_prefix and not url_prefix.startswith(("http://", "https://")):
+            url_prefix = self._project_prefix + url_prefix
+        with self._etag_lock:
+            for url in [url for url in self._etag_cache if url.startswith(url_prefix)]:
+                del self._etag_cache[url]
+
+    def _conditional(
+        self, method: str, url: str, headers: Dict[str, str]
+    ) -> Tuple[Optional[Tuple[str, bytes]], Dict[str, str]]:
+        if method != "GET" or not self._etag_cache_size:
+            return None, headers
+        cached = self._etag_cache.get(url)
+        if cached is None:
+            return None, headers
+        return cached, {**headers, "If-None-Match": cached[0]}
+
+    def _finish(self, method: str, url: str, resp: Any, cached: Optional[Tuple[str, bytes]]) -> Any:
+        if resp.status_code == 304 and cached is not None:
+            return _decode_body(cached[1]) if cached[1] else None
+        _raise_for_status(resp)
+        data = _response_json(resp)
+        etag = resp.headers.get("ETag") if method == "GET" and self._etag_cache_size else None
+        if etag:
+            with self._etag_lock:
+                self._etag_cache.pop(url, None)
+                if len(self._etag_cache) >= self._etag_cache_size:
+                    del self._etag_cache[next(iter(self._etag_cache))]
+                self._etag_cache[url] = (etag, resp.content if data is not None else b"")
+        return data
 
     def _project_path(self, suffix: str) -> str:
-        return urllib.parse.urljoin(self.base_url, f"/v0/projects/{self.project_id}/{suffix}")
+        return self._project_prefix + suffix
 
-    def _request(self, method: str, url: str, body: Optional[Dict[str, Any]] = None):
+    def _events_url(self, entity_ids: List[str], limit: int) -> str:
+        if not entity_ids:
+            return f"{self._events_base}?limit={limit}"
+        return f"{self._events_base}?{urllib.parse.urlencode({'limit': limit, 'entity_ids': ','.join(entity_ids)})}"
+
+    def _headers(self) -> Dict[str, str]:
         headers = {"Content-Type": "application/json"}
         if self.access_token:
             headers["Authorization"] = f"Bearer {self.access_token}"
         elif self.api_key:
             headers["X-Api-Key"] = self.api_key
-        data = json.dumps(body) if body is not None else None
-        resp = self.session.request(method, url, data=data, headers=headers, timeout=self.timeout)
-        if resp.status_code >= 300:
-            try:
-                err = resp.json()
-            except Exception:
-                err = resp.text
-            raise APIError(resp.status_code, err)
-        if resp.content:
-            return resp.json()
+        return headers
+
+    def _encode_request(self, body: Optional[Dict[str, Any]]) -> Tuple[Optional[bytes], Dict[str, str]]:
+        data = _encode_body(body)
+        if data is not None and len(data) > GZIP_MIN_BODY_BYTES:
+            return gzip.compress(data, compresslevel=5), {**self._default_headers, "Content-Encoding": "gzip"}
+        return data, self._default_headers
+
+
+def create_session() -> requests.Session:
+    """Return a requests.Session with a pooled, retrying adapter mounted.
+
+    Sessions are safe to share across threads and across clients; auth headers
+    are sent per request, so one session can serve several actors.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=SESSION_POOL_CONNECTIONS,
+        pool_maxsize=SESSION_POOL_MAXSIZE,
+        max_retries=SESSION_RETRY,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _encode_body(body: Optional[Dict[str, Any]]) -> Optional[bytes]:
+    # Always serialized here, once, to bytes: the clients pass them as data=/
+    # content= (never json=, which would re-encode with stdlib json), and a
+    # bytes body is framed with Content-Length rather than chunked encoding.
+    # OPT_NON_STR_KEYS stringifies non-str dict keys as stdlib json does; unlike
+    # stdlib (which writes NaN/Infinity), orjson writes NaN/Inf floats as null.
+    if body is None:
+        return None
+    if orjson is not None:
+        return orjson.dumps(body, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(body, separators=(",", ":")).encode()
+
+
+def _decode_body(content: bytes) -> Any:
+    # Parses the raw bytes directly rather than going through resp.json().
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _response_json(resp: Any) -> Any:
+    # 204s and empty bodies are answered without touching or parsing the content.
+    if resp.status_code == 204 or resp.headers.get("Content-Length") == "0":
+        return None
+    content = resp.content
+    if not content:
         return None
+    return _decode_body(content)
+
+
+def _raise_for_status(resp: Any) -> None:
+    if resp.status_code >= 300:
+        # Only the head of an error body is kept; a cut-off JSON body is then
+        # reported as text.
+        raise APIError(resp.status_code, raw=resp.content[:MAX_ERROR_BODY_BYTES])
+
+
+class WorklineClient(_BaseClient):
+    """Blocking client for the Workline HTTP API backed by requests.
+
+    GET responses carrying an ETag are kept (as raw bytes, up to etag_cache_size
+    URLs; 0 disables this) and revalidated with If-None-Match. A 304 skips the
+    transfer but the body is still decoded, so returned objects are never
+    shared between calls. Use invalidate() to forget cached URLs.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        project_id: str,
+        actor_id: Optional[str] = None,
+        api_key: Optional[str] = None,
+        access_token: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        timeout: float = 10.0,
+        etag_cache_size: int = ETAG_CACHE_SIZE,
+    ):
+        super().__init__(base_url, project_id, actor_id, api_key, access_token, timeout, etag_cache_size)
+        # Requests share the session's keep-alive pool; reuse one client (or one
+        # create_session() session) per process, including across threads.
+        self._owns_session = session is None
+        self.session = session or create_session()
+        # Background pool for fire-and-forget writes, started on first use.
+        self._bg: Optional[ThreadPoolExecutor] = None
+        self._bg_lock = threading.Lock()
+        # Futures not yet known to have succeeded; failed ones stay until flush().
+        self._bg_pending: set = set()
+
+    def close(self) -> None:
+        if self._bg is not None:
+            self._bg.shutdown(wait=True)
+        if self._owns_session:
+            self.session.close()
+
+    def add_attestation_async(
+        self, entity_kind: str, entity_id: str, kind: str, payload: Any = None
+    ) -> "Future[Attestation]":
+        """Send add_attestation from a background thread; failures surface in flush()."""
+        with self._bg_lock:
+            if self._bg is None:
+                self._bg = ThreadPoolExecutor(max_workers=4, thread_name_prefix="workline-bg")
+            future = self._bg.submit(self.add_attestation, entity_kind, entity_id, kind, payload)
+            self._bg_pending.add(future)
+        future.add_done_callback(self._bg_done)
+        return future
+
+    def _bg_done(self, future: "Future[Any]") -> None:
+        if future.cancelled() or future.exception() is None:
+            with self._bg_lock:
+                self._bg_pending.discard(future)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait for background writes; re-raise the first failure since the last flush."""
+        with self._bg_lock:
+            pending = list(self._bg_pending)
+        done, not_done = wait(pending, timeout=timeout)
+        failed = [f for f in done if not f.cancelled() and f.exception() is not None]
+        with self._bg_lock:
+            self._bg_pending.difference_update(failed)
+        if failed:
+            raise failed[0].exception()
+        if not_done:
+            raise TimeoutError(f"{len(not_done)} background call(s) still pending")
+
+    def __enter__(self) -> "WorklineClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _request(self, method: str, url: str, body: Optional[Dict[str, Any]] = None):
+        data, headers = self._encode_request(body)
+        cached, headers = self._conditional(method, url, headers)
+        resp = self.session.request(method, url, data=data, headers=headers, timeout=self.timeout)
+        return self._finish(method, url, resp, cached)
+
+    def _request_void(self, method: str, url: str, body: Optional[Dict[str, Any]] = None) -> None:
+        # For calls whose response body is never read (acks, 204s): the body is
+        # not downloaded on success. An unread non-empty body closes the
+        # connection instead of returning it to the pool, so keep this to
+        # endpoints that answer with little or nothing.
+        data, headers = self._encode_request(body)
+        with self.session.request(method, url, data=data, headers=headers, timeout=self.timeout, stream=True) as resp:
+            _raise_for_status(resp)
 
     def create_task(self, title: str, task_type: str = "feature") -> Task:
         url = self._project_path("tasks")
         data = self._request("POST", url, {"title": title, "type": task_type})
-        return Task(
-            id=data["id"],
-            project_id=data["project_id"],
-            title=data["title"],
-            type=data["type"],
-            status=data["status"],
-        )
+        return _task(data)
+
+    def create_task_id(self, title: str, task_type: str = "feature") -> str:
+        """create_task for callers that only keep the new task's id."""
+        return self._request("POST", self._project_path("tasks"), {"title": title, "type": task_type})["id"]
 
     def add_attestation(self, entity_kind: str, entity_id: str, kind: str, payload: Any = None) -> Attestation:
-        url = self._project_path("attestations")
-        body = {"entity_kind": entity_kind, "entity_id": entity_id, "kind": kind}
-        if payload is not None:
-            body["payload"] = payload
-        data = self._request("POST", url, body)
-        return Attestation(
-            id=data["id"],
-            project_id=data["project_id"],
-            entity_kind=data["entity_kind"],
-            entity_id=data["entity_id"],
-            kind=data["kind"],
-            actor_id=data["actor_id"],
-            ts=data.get("ts"),
-            payload=data.get("payload"),
-        )
+        return self.add_attestations([_attestation_item(entity_kind, entity_id, kind, payload)])[0]
+
+    def add_attestation_id(self, entity_kind: str, entity_id: str, kind: str, payload: Any = None) -> str:
+        """add_attestation for callers that only keep the new attestation's id."""
+        body = {"items": [_attestation_item(entity_kind, entity_id, kind, payload)]}
+        return self._request("POST", self._project_path("attestations/batch"), body)["items"][0]["id"]
+
+    def add_attestations(self, items: List[Dict[str, Any]]) -> List[Attestation]:
+        """Record attestations (add_attestation fields per item) in one transaction.
+
+        At most ATTESTATION_BATCH_MAX items per call; split larger lists.
+        """
+        url = self._project_path("attestations/batch")
+        data = self._request("POST", url, {"items": items})
+        return [_attestation(row) for row in data["items"]]
 
     def events(self, limit: int = 20) -> List[Event]:
-        url = self._project_path(f"events?limit={limit}")
-        data = self._request("GET", url)
-        items = data.get("items", data)
-        return [
-            Event(
-                id=item["id"],
-                ts=item.get("ts"),
-                type=item["type"],
-                project_id=item.get("project_id"),
-                entity_kind=item.get("entity_kind"),
-                entity_id=item.get("entity_id"),
-                actor_id=item.get("actor_id"),
-                payload=item.get("payload"),
-            )
-            for item in items
-        ]
+        return self.events_multi([], limit=limit)
+
+    def events_multi(self, entity_ids: List[str], limit: int = 20) -> List[Event]:
+        """Latest events across the given entities (all entities when empty), newest first."""
+        return [_event(item) for item in self.events_raw(limit, entity_ids)]
+
+    def events_raw(self, limit: int = 20, entity_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Like events_multi, but returns the decoded items without building Event objects.
+
+        list-events always answers {"items": [...], "next_cursor": "..."}.
+        """
+        data = self._request("GET", self._events_url(entity_ids or [], limit))
+        return data["items"]
+
+    def iter_events(self, limit: int = 20, entity_ids: Optional[List[str]] = None) -> Iterator[Event]:
+        """Yield events as they are parsed off the wire (with ijson installed).
+
+        Meant for large limits: the response is never held in full, and closing
+        the iterator early drops the rest of the body unread.
+        """
+        if ijson is None:
+            yield from (_event(item) for item in self.events_raw(limit, entity_ids))
+            return
+        url = self._events_url(entity_ids or [], limit)
+        with self.session.request("GET", url, headers=self._default_headers, timeout=self.timeout, stream=True) as resp:
+            _raise_for_status(resp)
+            resp.raw.decode_content = True
+            for item in ijson.items(resp.raw, "items.item", use_float=True):
+                yield _event(item)
 
     def next_task(
         self,
@@ -178,7 +522,7 @@ class WorklineClient:
         return self._request("GET", url)
 
     def decompose_task(self, task_id: str, subtasks: List[Dict[str, Any]]) -> Dict[str, Any]:
-        url = self._project_path(f"tasks/{task_id}/decompose")
+        url = f"{self._project_prefix}tasks/{_Q(task_id, safe='')}/decompose"
         return self._request("POST", url, {"subtasks": subtasks})
 
     def compose_task(
@@ -188,7 +532,7 @@ class WorklineClient:
         summary: Optional[str] = None,
         work_outcomes: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        url = self._project_path(f"tasks/{task_id}/compose")
+        url = f"{self._project_prefix}tasks/{_Q(task_id, safe='')}/compose"
         body: Dict[str, Any] = {}
         if result is not None:
             body["result"] = result
@@ -199,22 +543,22 @@ class WorklineClient:
         return self._request("POST", url, body)
 
     def append_work_outcomes(self, task_id: str, path: str, value: Any) -> Dict[str, Any]:
-        url = self._project_path(f"tasks/{task_id}/work-outcomes/append")
+        url = f"{self._project_prefix}tasks/{_Q(task_id, safe='')}/work-outcomes/append"
         return self._request("POST", url, {"path": path, "value": value})
 
     def put_work_outcomes(self, task_id: str, path: str, value: Any) -> Dict[str, Any]:
-        url = self._project_path(f"tasks/{task_id}/work-outcomes/put")
+        url = f"{self._project_prefix}tasks/{_Q(task_id, safe='')}/work-outcomes/put"
         return self._request("POST", url, {"path": path, "value": value})
 
     def merge_work_outcomes(self, task_id: str, path: str, value: Dict[str, Any]) -> Dict[str, Any]:
-        url = self._project_path(f"tasks/{task_id}/work-outcomes/merge")
+        url = f"{self._project_prefix}tasks/{_Q(task_id, safe='')}/work-outcomes/merge"
         return self._request("POST", url, {"path": path, "value": value})
 
     def actor_profile(self, actor_id: Optional[str] = None) -> ActorProfile:
         target = actor_id or self.actor_id
         if not target:
             raise ValueError("actor_id is required")
-        url = self._project_path(f"actors/{target}/profile")
+        url = f"{self._project_prefix}actors/{_Q(target, safe='')}/profile"
         data = self._request("GET", url)
         return ActorProfile(
             project_id=data["project_id"],
@@ -243,7 +587,7 @@ class WorklineClient:
             payload["issues"] = issues
         if url is not None:
             payload["url"] = url
-        data = self._request("POST", self._project_path(f"tasks/{task_id}/validations"), payload)
+        data = self._request("POST", f"{self._project_prefix}tasks/{_Q(task_id, safe='')}/validations", payload)
         return Validation(
             id=data["id"],
             project_id=data["project_id"],
@@ -259,7 +603,7 @@ class WorklineClient:
         )
 
     def list_validations(self, task_id: str) -> List[Validation]:
-        data = self._request("GET", self._project_path(f"tasks/{task_id}/validations"))
+        data = self._request("GET", f"{self._project_prefix}tasks/{_Q(task_id, safe='')}/validations")
         items = data.get("items", [])
         return [
             Validation(
@@ -279,7 +623,7 @@ class WorklineClient:
         ]
 
     def get_validation(self, validation_id: str) -> Validation:
-        data = self._request("GET", self._project_path(f"validations/{validation_id}"))
+        data = self._request("GET", f"{self._project_prefix}validations/{_Q(validation_id, safe='')}")
         return Validation(
             id=data["id"],
             project_id=data["project_id"],
@@ -314,7 +658,7 @@ class WorklineClient:
             payload["issues"] = issues
         if url is not None:
             payload["url"] = url
-        data = self._request("PATCH", self._project_path(f"validations/{validation_id}"), payload)
+        data = self._request("PATCH", f"{self._project_prefix}validations/{_Q(validation_id, safe='')}", payload)
         return Validation(
             id=data["id"],
             project_id=data["project_id"],
@@ -328,3 +672,113 @@ class WorklineClient:
             created_at=data["created_at"],
             updated_at=data["updated_at"],
         )
+
+
+class AsyncWorklineClient(_BaseClient):
+    """Asyncio variant of WorklineClient backed by httpx.AsyncClient.
+
+    Shares WorklineClient's ETag revalidation (etag_cache_size, invalidate()).
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        project_id: str,
+        actor_id: Optional[str] = None,
+        api_key: Optional[str] = None,
+        access_token: Optional[str] = None,
+        client: Optional["httpx.AsyncClient"] = None,
+        timeout: float = 10.0,
+        http2: Optional[bool] = None,
+        etag_cache_size: int = ETAG_CACHE_SIZE,
+    ):
+        super().__init__(base_url, project_id, actor_id, api_key, access_token, timeout, etag_cache_size)
+        self._owns_client = client is None
+        if client is None:
+            if httpx is None:
+                raise RuntimeError("AsyncWorklineClient requires httpx (pip install httpx)")
+            if http2 is None:
+                http2 = HTTP2_AVAILABLE
+            client = httpx.AsyncClient(limits=DEFAULT_ASYNC_LIMITS, http2=http2)
+        self.client = client
+
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncWorklineClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def _request(self, method: str, url: str, body: Optional[Dict[str, Any]] = None):
+        data, headers = self._encode_request(body)
+        cached, headers = self._conditional(method, url, headers)
+        resp = await self.client.request(method, url, content=data, headers=headers, timeout=self.timeout)
+        return self._finish(method, url, resp, cached)
+
+    async def create_task(self, title: str, task_type: str = "feature") -> Task:
+        url = self._project_path("tasks")
+        data = await self._request("POST", url, {"title": title, "type": task_type})
+        return _task(data)
+
+    async def create_task_id(self, title: str, task_type: str = "feature") -> str:
+        data = await self._request("POST", self._project_path("tasks"), {"title": title, "type": task_type})
+        return data["id"]
+
+    async def add_attestation(self, entity_kind: str, entity_id: str, kind: str, payload: Any = None) -> Attestation:
+        return (await self.add_attestations([_attestation_item(entity_kind, entity_id, kind, payload)]))[0]
+
+    async def add_attestation_id(self, entity_kind: str, entity_id: str, kind: str, payload: Any = None) -> str:
+        body = {"items": [_attestation_item(entity_kind, entity_id, kind, payload)]}
+        data = await self._request("POST", self._project_path("attestations/batch"), body)
+        return data["items"][0]["id"]
+
+    async def add_attestations(self, items: List[Dict[str, Any]]) -> List[Attestation]:
+        """Async add_attestations; at most ATTESTATION_BATCH_MAX items per call."""
+        url = self._project_path("attestations/batch")
+        data = await self._request("POST", url, {"items": items})
+        return [_attestation(row) for row in data["items"]]
+
+    async def events(self, limit: int = 20) -> List[Event]:
+        return await self.events_multi([], limit=limit)
+
+    async def events_multi(self, entity_ids: List[str], limit: int = 20) -> List[Event]:
+        return [_event(item) for item in await self.events_raw(limit, entity_ids)]
+
+    async def events_raw(self, limit: int = 20, entity_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        data = await self._request("GET", self._events_url(entity_ids or [], limit))
+        return data["items"]
+
+    async def append_work_outcomes(self, task_id: str, path: str, value: Any) -> Dict[str, Any]:
+        url = f"{self._project_prefix}tasks/{_Q(task_id, safe='')}/work-outcomes/append"
+        return await self._request("POST", url, {"path": path, "value": value})
+
+    async def put_work_outcomes(self, task_id: str, path: str, value: Any) -> Dict[str, Any]:
+        url = f"{self._project_prefix}tasks/{_Q(task_id, safe='')}/work-outcomes/put"
+        return await self._request("POST", url, {"path": path, "value": value})
+
+    async def merge_work_outcomes(self, task_id: str, path: str, value: Dict[str, Any]) -> Dict[str, Any]:
+        url = f"{self._project_prefix}tasks/{_Q(task_id, safe='')}/work-outcomes/merge"
+        return await self._request("POST", url, {"path": path, "value": value})
+
+
+async def gather_attestations(calls: Iterable[Awaitable[Attestation]]) -> List[Attestation]:
+    """Await independent add_attestation coroutines concurrently, in input order."""
+    return list(await asyncio.gather(*calls))
+
+
+def map_calls(calls: Iterable[Callable[[], T]], max_workers: int = 8) -> List[T]:
+    """Run independent blocking SDK calls on a thread pool; results keep input order.
+
+    WorklineClient is safe to share across the worker threads. Once all calls
+    have finished, the exception of the first failing call (in input order) is
+    re-raised.
+    """
+    calls = list(calls)
+    if not calls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as pool:
+        futures = [pool.submit(call) for call in calls]
+    return [future.result() for future in futures]